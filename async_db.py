@@ -0,0 +1,286 @@
+# async_db.py - asyncio data access alongside the blocking helpers in config
+"""
+Async counterparts of ``fetch_details`` / ``execute_query`` built on an
+``aiomysql`` pool, for batch jobs that want many statements in flight at
+once, and a sync bridge so Streamlit pages can adopt them one call at a
+time:
+
+    rows = await async_db.fetch("SELECT ... WHERE id=%s", (student_id,))
+    async with async_db.transaction() as tx:
+        await tx.execute("UPDATE results SET grade=%s WHERE id=%s", (grade, id))
+
+    rows = async_db.run(async_db.fetch("SELECT ..."))     # from sync code
+
+Every statement has a timeout (``DB_ASYNC_TIMEOUT``); a statement that
+times out or is cancelled closes its connection instead of returning it
+to the pool, since the server may still be sending its result.
+``gather()`` runs many statements with at most ``DB_ASYNC_CONCURRENCY``
+in flight. Statements are recorded in ``query_stats`` and writes
+invalidate the result cache, exactly like the sync helpers.
+
+Needs the optional ``aiomysql`` package; it is listed, commented out, in
+``requirements.txt``.
+"""
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+
+import query_cache
+import query_stats
+from config import get_db_config, get_pool_config, get_stream_chunk_size, note_write
+
+TIMEOUT = float(os.getenv("DB_ASYNC_TIMEOUT", "30"))
+CONCURRENCY = int(os.getenv("DB_ASYNC_CONCURRENCY", "100"))
+
+_pools = {}  # event loop -> aiomysql pool; pools cannot cross loops
+_pools_lock = threading.Lock()
+_create_locks = {}  # event loop -> asyncio.Lock serializing pool creation
+
+
+def _driver():
+    try:
+        import aiomysql
+    except ImportError:
+        raise ImportError("Async database access needs aiomysql (pip install aiomysql)")
+    return aiomysql
+
+
+# -------------------------------------------------------------
+# Pool
+# -------------------------------------------------------------
+async def get_pool():
+    """Return the pool for the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        lock = _create_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        # Another task may have created it while this one waited
+        pool = _pools.get(loop)
+        if pool is None:
+            aiomysql = _driver()
+            db = get_db_config()
+            pool_config = get_pool_config()
+            pool = await aiomysql.create_pool(
+                host=db["host"], port=db["port"], user=db["user"], password=db["password"],
+                db=db["database"], autocommit=False,
+                minsize=0, maxsize=int(os.getenv("DB_ASYNC_POOL_SIZE", str(pool_config["size"]))),
+                pool_recycle=pool_config["max_idle"],
+            )
+            with _pools_lock:
+                _pools[loop] = pool
+    return pool
+
+
+async def close_pool():
+    """Close the pool of the running event loop"""
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pool = _pools.pop(loop, None)
+        _create_locks.pop(loop, None)
+    if pool is not None:
+        pool.close()
+        await pool.wait_closed()
+
+
+@asynccontextmanager
+async def connection():
+    """Borrow a connection; it is closed rather than reused if the block fails"""
+    pool = await get_pool()
+    conn = await asyncio.wait_for(pool.acquire(), get_pool_config()["timeout"])
+    try:
+        yield conn
+    except BaseException:
+        conn.close()
+        raise
+    finally:
+        pool.release(conn)
+
+
+async def _run(coro, timeout):
+    return await asyncio.wait_for(coro, TIMEOUT if timeout is None else timeout)
+
+
+# -------------------------------------------------------------
+# Statements
+# -------------------------------------------------------------
+async def _fetch(conn, query, params, acquire_ms=0.0):
+    async with conn.cursor() as cursor:
+        with query_stats.timed(query, acquire_ms) as timing:
+            await cursor.execute(query, params or ())
+            rows = await cursor.fetchall()
+            timing["rows"] = len(rows)
+    return list(rows)
+
+
+async def _execute(conn, query, params, acquire_ms=0.0):
+    async with conn.cursor() as cursor:
+        with query_stats.timed(query, acquire_ms) as timing:
+            await cursor.execute(query, params or ())
+            timing["rows"] = max(cursor.rowcount, 0)
+        return cursor.rowcount, cursor.lastrowid
+
+
+async def fetch(query, params=None, timeout=None):
+    """Execute SELECT query and return all rows"""
+    async def work():
+        started = time.perf_counter()
+        async with connection() as conn:
+            return await _fetch(conn, query, params, (time.perf_counter() - started) * 1000)
+    return await _run(work(), timeout)
+
+
+async def execute(query, params=None, timeout=None):
+    """Execute INSERT/UPDATE/DELETE query, commit, and return the row count"""
+    async def work():
+        started = time.perf_counter()
+        async with connection() as conn:
+            rowcount, _ = await _execute(conn, query, params, (time.perf_counter() - started) * 1000)
+            await conn.commit()
+            return rowcount
+    rowcount = await _run(work(), timeout)
+    note_write()
+    query_cache.invalidate_tables(query_cache.tables_in(query))
+    return rowcount
+
+
+async def stream(query, params=None, size=None, timeout=None):
+    """Yield lists of up to ``size`` rows from an unbuffered cursor.
+
+    ``timeout`` applies to each round trip, not to the whole stream.
+    """
+    aiomysql = _driver()
+    size = size or get_stream_chunk_size()
+    async with connection() as conn:
+        async with conn.cursor(aiomysql.SSCursor) as cursor:
+            with query_stats.timed(query) as timing:
+                await _run(cursor.execute(query, params or ()), timeout)
+                while True:
+                    rows = await _run(cursor.fetchmany(size), timeout)
+                    if not rows:
+                        break
+                    timing["rows"] += len(rows)
+                    yield list(rows)
+
+
+async def gather(queries, limit=None, timeout=None):
+    """Run many ``(query, params)`` SELECTs concurrently; results in order.
+
+    At most ``limit`` (default ``DB_ASYNC_CONCURRENCY``) are in flight, and
+    each also waits for a pool connection. If one fails the others are
+    cancelled and the error is raised.
+    """
+    semaphore = asyncio.Semaphore(limit or CONCURRENCY)
+
+    async def one(query, params):
+        async with semaphore:
+            return await fetch(query, params, timeout)
+
+    tasks = [asyncio.ensure_future(one(query, params)) for query, params in queries]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+# -------------------------------------------------------------
+# Transactions
+# -------------------------------------------------------------
+class AsyncTransaction:
+    """Async statements that run on one connection and are committed together"""
+
+    def __init__(self, conn, timeout):
+        self._conn = conn
+        self._timeout = timeout
+        self.lastrowid = None
+        self.tables = set()  # written tables, invalidated in the cache on commit
+
+    async def execute(self, query, params=None):
+        """Run an INSERT/UPDATE/DELETE and return the affected row count"""
+        self.tables |= query_cache.tables_in(query)
+        rowcount, self.lastrowid = await _run(_execute(self._conn, query, params), self._timeout)
+        return rowcount
+
+    async def execute_many(self, query, seq_params):
+        """Run one statement for a list of parameter rows"""
+        self.tables |= query_cache.tables_in(query)
+
+        async def work():
+            async with self._conn.cursor() as cursor:
+                with query_stats.timed(query) as timing:
+                    await cursor.executemany(query, list(seq_params))
+                    timing["rows"] = max(cursor.rowcount, 0)
+                return cursor.rowcount
+        return await _run(work(), self._timeout)
+
+    async def fetch(self, query, params=None):
+        """Run a SELECT inside the transaction and return all rows"""
+        return await _run(_fetch(self._conn, query, params), self._timeout)
+
+
+@asynccontextmanager
+async def transaction(timeout=None):
+    """Async counterpart of ``config.transaction``; ``timeout`` is per statement"""
+    async with connection() as conn:
+        await conn.begin()
+        tx = AsyncTransaction(conn, timeout)
+        try:
+            yield tx
+            await conn.commit()
+        except BaseException:
+            try:
+                await asyncio.shield(conn.rollback())
+            except Exception:
+                pass
+            raise
+    if tx.tables:
+        note_write()
+    query_cache.invalidate_tables(tx.tables)
+
+
+# -------------------------------------------------------------
+# Sync bridge
+# -------------------------------------------------------------
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop():
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="async-db", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def run(coro, timeout=None):
+    """Run ``coro`` on the shared background event loop and wait for its result.
+
+    Lets sync code (Streamlit pages, CLIs) use the async helpers without
+    owning an event loop. If ``timeout`` expires the coroutine is cancelled
+    and TimeoutError is raised.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _background_loop())
+    try:
+        return future.result(timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+if __name__ == "__main__":
+    print("🔍 Testing async MySQL connection...")
+    try:
+        rows = run(fetch("SELECT DATABASE()"))
+        print(f"✅ Connected to database: {rows[0][0]}")
+    except Exception as e:
+        print(f"❌ Async connection failed: {e}")
@@ -0,0 +1,518 @@
+# benchmark.py - Latency and scaling benchmarks for every dashboard query path
+"""
+Runs the SQL behind each dashboard page against generated datasets of
+increasing size and records how latency grows.
+
+    python benchmark.py --backend sqlite --sizes 1000,5000,20000
+    python benchmark.py --backend mysql                        # existing data
+    python benchmark.py --backend mysql --sizes 20000 --load   # truncates DB_NAME!
+    python benchmark.py --compare bench_results/old.json bench_results/new.json
+
+The ``sqlite`` backend is an in-memory stand-in that needs no server, so the
+suite runs on a laptop. It uses the same schema and indexes, so relative
+scaling is comparable even though absolute numbers differ from MySQL. The
+``mysql`` backend uses the connection settings from ``.env`` and measures
+the data already in the database; ``--sizes`` is ignored. Pass ``--load``
+to regenerate the data at each size instead; this truncates every table.
+
+Results are written as JSON under ``bench_results/``, tagged with the git
+commit, so runs can be compared before and after a change.
+
+``QUERY_PATHS`` mirrors the statements the pages issue. Keep it in step
+when a page's queries change. MySQL-only constructs (FULLTEXT search) are
+left out so every path runs on both backends.
+"""
+import argparse
+import datetime
+import json
+import os
+import re
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+
+import generate_data
+import gpa
+import rollups
+import stats_service
+from config import Transaction, get_connection
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_results")
+BENCH_DATE = datetime.date(2025, 6, 30)  # fixed so runs are comparable
+PAGE_SIZE = 50  # pagination.PAGE_SIZE default
+
+
+# -------------------------------------------------------------
+# Query paths
+# -------------------------------------------------------------
+# Each path is a list of (sql, params) steps. ``params`` is a function of the
+# sample context; it may return a list of tuples to run the step once per
+# tuple (this is how the N+1 loops in the pages are reproduced). When
+# ``sql`` is None the function returns ``(sql, params)`` instead.
+QUERY_PATHS = {
+    "login": [
+        ("SELECT typeOfUser FROM login_details WHERE uname=%s AND password=%s",
+         lambda ctx: (ctx["student_uname"], "student123")),
+    ],
+    "admin_overview": [
+        (stats_service.OVERVIEW_QUERY, None),
+    ],
+    "manage_students": [
+        ("SELECT id, name, age, sex, phoneno FROM student_details ORDER BY name, id LIMIT %s",
+         lambda ctx: (PAGE_SIZE + 1,)),
+    ],
+    "manage_students_deep_page": [
+        ("""SELECT id, name, age, sex, phoneno FROM student_details
+            WHERE (name > %s OR (name = %s AND id > %s))
+            ORDER BY name, id LIMIT %s""",
+         lambda ctx: (ctx["student_name"], ctx["student_name"], ctx["student_id"], PAGE_SIZE + 1)),
+    ],
+    "manage_students_search": [
+        ("SELECT id, name, age, sex, phoneno FROM student_details WHERE name LIKE %s ORDER BY name, id LIMIT %s",
+         lambda ctx: (ctx["student_name"][:4] + "%", PAGE_SIZE + 1)),
+        ("SELECT id, name, age, sex, phoneno FROM student_details WHERE phoneno LIKE %s ORDER BY name, id LIMIT %s",
+         lambda ctx: ("98%", PAGE_SIZE + 1)),
+    ],
+    "manage_faculty": [
+        ("""SELECT f.id, f.name, f.department, f.phoneno,
+                   (SELECT MIN(l.uname) FROM login_details l
+                    WHERE l.user_id = f.id AND l.typeOfUser = 'faculty') AS login_name
+            FROM faculty_details f ORDER BY f.name, f.id LIMIT %s""", lambda ctx: (PAGE_SIZE + 1,)),
+        (None, lambda ctx: (
+            "SELECT faculty_id, course, subject, year, semester FROM faculty_teaching WHERE faculty_id IN ({}) ORDER BY id"
+            .format(", ".join(["%s"] * len(ctx["faculty_ids"][:PAGE_SIZE]))),
+            tuple(ctx["faculty_ids"][:PAGE_SIZE]))),
+    ],
+    "student_reports_grades": [
+        ("""SELECT s.name, r.course, r.grade, f.name
+            FROM results r
+            JOIN student_details s ON r.student_id = s.id
+            JOIN faculty_details f ON r.faculty_id = f.id
+            WHERE r.course IS NOT NULL AND TRIM(r.course) != ''
+            ORDER BY s.name, r.course""", None),
+    ],
+    "student_reports_attendance": [
+        ("SELECT student_name, date, status FROM attendance ORDER BY date DESC LIMIT 100", None),
+    ],
+    "student_reports_fees": [
+        ("SELECT student_name, amount, due_date, status FROM fees ORDER BY due_date DESC", None),
+    ],
+    "student_reports_gpa": [
+        ("""SELECT s.name, g.gpa
+            FROM student_gpa g
+            JOIN student_details s ON s.id = g.student_id
+            WHERE g.gpa IS NOT NULL
+            ORDER BY g.gpa DESC""", None),
+    ],
+    "faculty_reports": [
+        ("""SELECT f.name, f.department,
+                   COALESCE(g.students, 0) as students,
+                   COALESCE(g.courses, 0) as courses,
+                   g.gpa as avg_gpa
+            FROM faculty_details f
+            LEFT JOIN faculty_gpa g ON g.faculty_id = f.id
+            WHERE f.department = 'B.Tech'
+            ORDER BY g.gpa IS NULL, g.gpa DESC, students DESC""", None),
+    ],
+    "system_analytics": [
+        (stats_service.OVERVIEW_QUERY, None),
+        ("SELECT status, COUNT(*) as count FROM attendance GROUP BY status", None),
+        ("SELECT status, SUM(total) as total FROM fee_totals GROUP BY status HAVING SUM(records) > 0", None),
+        ("SELECT course, COUNT(DISTINCT student_id) FROM results GROUP BY course", None),
+    ],
+    "fees_analytics": [
+        ("SELECT status, SUM(records), SUM(total) FROM fee_totals GROUP BY status HAVING SUM(records) > 0", None),
+    ],
+    "faculty_dashboard": [
+        ("SELECT COUNT(*) FROM results WHERE faculty_id = %s", lambda ctx: (ctx["faculty_id"],)),
+        ("SELECT students, courses, gpa FROM faculty_gpa WHERE faculty_id=%s", lambda ctx: (ctx["faculty_id"],)),
+        ("SELECT COUNT(*) FROM attendance WHERE date=%s AND student_id IN (SELECT student_id FROM results WHERE faculty_id=%s)",
+         lambda ctx: (ctx["today"], ctx["faculty_id"])),
+        ("SELECT COUNT(*) FROM results WHERE faculty_id=%s AND grade IS NULL", lambda ctx: (ctx["faculty_id"],)),
+        ("""SELECT student_name, date, status FROM attendance
+            WHERE student_id IN (SELECT student_id FROM results WHERE faculty_id = %s)
+            ORDER BY date DESC LIMIT 10""", lambda ctx: (ctx["faculty_id"],)),
+    ],
+    "faculty_mark_attendance": [
+        ("""SELECT DISTINCT s.id, s.name FROM student_details s
+            JOIN results r ON s.id = r.student_id
+            WHERE r.faculty_id = %s ORDER BY s.name""", lambda ctx: (ctx["faculty_id"],)),
+    ],
+    "faculty_attendance_preload": [
+        (None, lambda ctx: (
+            "SELECT student_id, date, status FROM attendance WHERE date BETWEEN %s AND %s AND student_id IN ({})"
+            .format(", ".join(["%s"] * len(ctx["faculty_student_ids"]))),
+            (ctx["today"], ctx["today"], *ctx["faculty_student_ids"]))),
+    ],
+    "faculty_manage_grades": [
+        ("""SELECT r.course, r.id, s.id, s.name, r.grade
+            FROM results r LEFT JOIN student_details s ON r.student_id = s.id
+            WHERE r.faculty_id = %s AND r.course IS NOT NULL AND TRIM(r.course) != ''
+            ORDER BY r.course, s.name""", lambda ctx: (ctx["faculty_id"],)),
+    ],
+    "faculty_my_courses": [
+        ("""SELECT course, COUNT(DISTINCT student_id) FROM results
+            WHERE faculty_id = %s AND course IS NOT NULL GROUP BY course ORDER BY course""",
+         lambda ctx: (ctx["faculty_id"],)),
+        ("""SELECT grade, COUNT(*) FROM results
+            WHERE course=%s AND faculty_id=%s AND grade IS NOT NULL GROUP BY grade""",
+         lambda ctx: (ctx["faculty_course"], ctx["faculty_id"])),
+    ],
+    "student_dashboard": [
+        ("""SELECT sd.id, sd.name FROM student_details sd
+            JOIN login_details ld ON sd.id = ld.user_id
+            WHERE ld.uname=%s AND ld.typeOfUser='student'""", lambda ctx: (ctx["student_uname"],)),
+        ("SELECT sd.name, sd.age, sd.sex, sd.phoneno FROM student_details sd WHERE sd.id=%s",
+         lambda ctx: (ctx["student_id"],)),
+        ("SELECT SUM(present), SUM(present + absent) FROM attendance_monthly WHERE student_id=%s",
+         lambda ctx: (ctx["student_id"],)),
+        ("SELECT COUNT(DISTINCT course) FROM results WHERE student_id=%s", lambda ctx: (ctx["student_id"],)),
+        ("SELECT COUNT(DISTINCT course) FROM results WHERE student_id=%s AND grade IS NOT NULL",
+         lambda ctx: (ctx["student_id"],)),
+        ("SELECT status FROM fees WHERE student_name=%s ORDER BY due_date DESC LIMIT 1",
+         lambda ctx: (ctx["student_name"],)),
+        ("""SELECT DISTINCT r.course, COALESCE(f.name, 'Not Assigned'), r.grade
+            FROM results r LEFT JOIN faculty_details f ON r.faculty_id = f.id
+            WHERE r.student_id = %s ORDER BY r.course""", lambda ctx: (ctx["student_id"],)),
+    ],
+    "student_grades": [
+        ("""SELECT r.course, r.grade, COALESCE(f.name, 'Not Assigned')
+            FROM results r LEFT JOIN faculty_details f ON r.faculty_id = f.id
+            WHERE r.student_id = %s ORDER BY r.course""", lambda ctx: (ctx["student_id"],)),
+        ("SELECT gpa FROM student_gpa WHERE student_id=%s AND gpa IS NOT NULL", lambda ctx: (ctx["student_id"],)),
+    ],
+    "student_attendance_history": [
+        ("SELECT date, status FROM attendance WHERE student_id=%s ORDER BY date DESC LIMIT 30",
+         lambda ctx: (ctx["student_id"],)),
+    ],
+    "student_fees": [
+        ("SELECT amount, due_date, status FROM fees WHERE student_name=%s ORDER BY due_date DESC",
+         lambda ctx: (ctx["student_name"],)),
+    ],
+}
+
+
+# -------------------------------------------------------------
+# Backends
+# -------------------------------------------------------------
+SQLITE_SCHEMA = """
+CREATE TABLE student_details (id INTEGER PRIMARY KEY, name TEXT, age INTEGER, sex TEXT, phoneno TEXT);
+CREATE INDEX idx_student_name ON student_details (name, id);
+CREATE INDEX idx_student_phone ON student_details (phoneno);
+CREATE TABLE faculty_details (id INTEGER PRIMARY KEY, name TEXT, department TEXT, phoneno TEXT,
+                              qualification TEXT, email TEXT);
+CREATE INDEX idx_faculty_phone ON faculty_details (phoneno);
+CREATE INDEX idx_faculty_email ON faculty_details (email);
+CREATE INDEX idx_faculty_name ON faculty_details (name, id);
+CREATE TABLE faculty_teaching (id INTEGER PRIMARY KEY, faculty_id INTEGER NOT NULL, course TEXT, subject TEXT,
+                               year TEXT, semester TEXT, designation TEXT);
+CREATE INDEX idx_faculty_teaching_faculty ON faculty_teaching (faculty_id);
+CREATE TABLE login_details (uname TEXT PRIMARY KEY, password TEXT, typeOfUser TEXT, email TEXT,
+                            phoneno TEXT, user_id INTEGER);
+CREATE INDEX idx_login_user ON login_details (user_id, typeOfUser, uname);
+CREATE TABLE results (id INTEGER PRIMARY KEY, student_id INTEGER, faculty_id INTEGER, course TEXT, grade TEXT);
+CREATE INDEX results_student_id ON results (student_id);
+CREATE INDEX results_faculty_id ON results (faculty_id);
+CREATE TABLE attendance (id INTEGER PRIMARY KEY, student_id INTEGER, student_name TEXT, date TEXT, status TEXT);
+CREATE UNIQUE INDEX uq_attendance_student_date ON attendance (student_id, date);
+CREATE INDEX idx_attendance_date ON attendance (date);
+CREATE INDEX idx_attendance_status ON attendance (status);
+CREATE TABLE fees (id INTEGER PRIMARY KEY, student_name TEXT, amount REAL, due_date TEXT, status TEXT,
+                   fee_type TEXT DEFAULT 'Tuition', description TEXT, created_at TEXT);
+CREATE INDEX idx_fees_due_date ON fees (due_date, id);
+CREATE TABLE attendance_monthly (student_id INTEGER NOT NULL, month TEXT NOT NULL, present INTEGER NOT NULL,
+                                 absent INTEGER NOT NULL, PRIMARY KEY (student_id, month));
+CREATE INDEX idx_attendance_monthly_month ON attendance_monthly (month);
+CREATE TABLE fee_totals (status TEXT NOT NULL, fee_type TEXT NOT NULL, records INTEGER NOT NULL, total REAL NOT NULL,
+                         PRIMARY KEY (status, fee_type));
+CREATE TABLE student_gpa (student_id INTEGER PRIMARY KEY, graded_courses INTEGER NOT NULL, total_points REAL NOT NULL,
+                          gpa REAL);
+CREATE INDEX idx_student_gpa_gpa ON student_gpa (gpa);
+CREATE TABLE faculty_gpa (faculty_id INTEGER PRIMARY KEY, students INTEGER NOT NULL, courses INTEGER NOT NULL,
+                          graded INTEGER NOT NULL, gpa REAL);
+CREATE INDEX idx_faculty_gpa_gpa ON faculty_gpa (gpa);
+"""
+
+# rollups.rebuild() uses MySQL's DATE_FORMAT; same result in SQLite terms
+SQLITE_ROLLUPS = """
+INSERT INTO attendance_monthly (student_id, month, present, absent)
+SELECT student_id, strftime('%Y-%m-01', date),
+       SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END),
+       SUM(CASE WHEN status = 'Present' THEN 0 ELSE 1 END)
+FROM attendance GROUP BY student_id, strftime('%Y-%m-01', date);
+INSERT INTO fee_totals (status, fee_type, records, total)
+SELECT COALESCE(status, ''), COALESCE(fee_type, ''), COUNT(*), COALESCE(SUM(amount), 0)
+FROM fees GROUP BY COALESCE(status, ''), COALESCE(fee_type, '');
+"""
+
+_PLACEHOLDER_RE = re.compile(r"%s")
+
+
+class _SQLiteTransaction:
+    """Just enough of config.Transaction to run the portable rebuild helpers"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def execute(self, query, params=None):
+        return self._conn.execute(_PLACEHOLDER_RE.sub("?", query), tuple(params or ())).rowcount
+
+    def fetch(self, query, params=None):
+        return self._conn.execute(_PLACEHOLDER_RE.sub("?", query), tuple(params or ())).fetchall()
+
+
+class SQLiteBackend:
+    """In-memory stand-in for MySQL; translates %s placeholders to ?"""
+
+    name = "sqlite"
+    reloads = True
+
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:")
+        # Lets LIKE 'prefix%' use an index, as it does under MySQL's collation
+        self.conn.execute("PRAGMA case_sensitive_like = ON")
+        self.conn.executescript(SQLITE_SCHEMA)
+
+    def load(self, dataset):
+        for table, columns, rows in dataset:
+            self.conn.executemany(generate_data.insert_sql(table, columns, "?"),
+                                  ([v.isoformat() if isinstance(v, datetime.date) else v for v in row] for row in rows))
+        self.conn.executescript(SQLITE_ROLLUPS)
+        gpa.rebuild(_SQLiteTransaction(self.conn))
+        self.conn.commit()
+        self.conn.execute("ANALYZE")
+
+    def reset(self):
+        self.conn.close()
+        self.__init__()
+
+    def execute(self, sql, params=()):
+        params = tuple(p.isoformat() if isinstance(p, datetime.date) else p for p in params)
+        return self.conn.execute(_PLACEHOLDER_RE.sub("?", sql), params).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+class MySQLBackend:
+    """Runs against the database configured in .env on one direct connection"""
+
+    name = "mysql"
+
+    def __init__(self, load=False):
+        self.conn = get_connection()
+        if not self.conn:
+            raise SystemExit(1)
+        self.reloads = load
+
+    def reset(self):
+        if not self.reloads:
+            raise SystemExit("❌ Refusing to truncate tables without --load")
+        cursor = self.conn.cursor()
+        cursor.execute("SET SESSION foreign_key_checks = 0")
+        cursor.execute("SET SESSION unique_checks = 0")
+        cursor.close()
+        generate_data.reset(self.conn)
+
+    def load(self, dataset):
+        generate_data.load(self.conn, dataset)
+        self.conn.start_transaction()
+        rollups.rebuild(Transaction(self.conn))
+        gpa.rebuild(Transaction(self.conn))
+        self.conn.commit()
+        cursor = self.conn.cursor()
+        for table in generate_data.TABLES + ["attendance_monthly", "fee_totals", "student_gpa", "faculty_gpa"]:
+            cursor.execute(f"ANALYZE TABLE {table}")
+            cursor.fetchall()
+        cursor.close()
+
+    def execute(self, sql, params=()):
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            self.conn.commit()  # end the read snapshot between runs
+
+    def close(self):
+        self.conn.close()
+
+
+# -------------------------------------------------------------
+# Runner
+# -------------------------------------------------------------
+def build_context(backend):
+    """Pick representative ids from the loaded data"""
+    student_id, student_name = backend.execute(
+        "SELECT id, name FROM student_details ORDER BY id LIMIT 1 OFFSET 7")[0]
+    student_uname = backend.execute(
+        "SELECT uname FROM login_details WHERE user_id=%s AND typeOfUser='student'", (student_id,))[0][0]
+    faculty_id, faculty_course = backend.execute("""
+        SELECT faculty_id, course FROM results
+        GROUP BY faculty_id, course ORDER BY COUNT(*) DESC LIMIT 1
+    """)[0]
+    faculty_student_ids = [r[0] for r in backend.execute(
+        "SELECT DISTINCT student_id FROM results WHERE faculty_id=%s", (faculty_id,))]
+    faculty_ids = [r[0] for r in backend.execute("SELECT id FROM faculty_details ORDER BY name")]
+    return {
+        "student_id": student_id,
+        "student_name": student_name,
+        "student_uname": student_uname,
+        "faculty_id": faculty_id,
+        "faculty_course": faculty_course,
+        "faculty_ids": faculty_ids,
+        "faculty_student_ids": faculty_student_ids,
+        "today": BENCH_DATE if backend.reloads else datetime.date.today(),
+    }
+
+
+def run_path(backend, steps, ctx):
+    """Execute every step of one path once; returns (elapsed_ms, statements, rows)"""
+    statements = rows = 0
+    started = time.perf_counter()
+    for sql, params_fn in steps:
+        params = params_fn(ctx) if params_fn else ()
+        if sql is None:
+            sql, params = params  # statement shape depends on the data (IN lists)
+        for p in (params if isinstance(params, list) else [params]):
+            rows += len(backend.execute(sql, p))
+            statements += 1
+    return (time.perf_counter() - started) * 1000, statements, rows
+
+
+def benchmark(backend, sizes, repeat, seed, days, paths):
+    results = []
+    for students in sizes:
+        if backend.reloads:
+            faculty = max(60, students // 33)
+            print(f"\n🏗️  Loading {students:,} students / {faculty:,} faculty / {days} days ({backend.name})")
+            backend.reset()
+            started = time.monotonic()
+            backend.load(generate_data.generate_dataset(students, faculty, days, seed, end_date=BENCH_DATE))
+            print(f"   loaded in {time.monotonic() - started:.1f}s")
+        else:
+            print(f"\n📏 Measuring the existing {students:,} students ({backend.name})")
+        ctx = build_context(backend)
+
+        for name in paths:
+            run_path(backend, QUERY_PATHS[name], ctx)  # warm-up
+            timings = []
+            for _ in range(repeat):
+                elapsed, statements, rows = run_path(backend, QUERY_PATHS[name], ctx)
+                timings.append(elapsed)
+            timings.sort()
+            entry = {
+                "path": name,
+                "students": students,
+                "statements": statements,
+                "rows": rows,
+                "median_ms": round(statistics.median(timings), 3),
+                "min_ms": round(timings[0], 3),
+                "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+            }
+            results.append(entry)
+            print(f"   {name:<28} {entry['median_ms']:>10.2f} ms  {statements:>5} stmts  {rows:>8} rows")
+    return results
+
+
+def print_scaling(results, sizes):
+    """One row per path, one column per dataset size, plus growth factor"""
+    by_path = {}
+    for r in results:
+        by_path.setdefault(r["path"], {})[r["students"]] = r["median_ms"]
+
+    header = f"{'path':<28}" + "".join(f"{s:>12,}" for s in sizes) + f"{'growth':>10}"
+    print(f"\n📈 Median latency (ms) by student count\n{header}")
+    for path, timings in by_path.items():
+        cells = "".join(f"{timings.get(s, float('nan')):>12.2f}" for s in sizes)
+        first, last = timings.get(sizes[0]), timings.get(sizes[-1])
+        growth = f"{last / first:>9.1f}x" if first and last and len(sizes) > 1 else f"{'':>10}"
+        print(f"{path:<28}{cells}{growth}")
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def save(results, args):
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    revision = git_revision()
+    stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = args.output or os.path.join(RESULTS_DIR, f"{stamp}-{revision}-{args.backend}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "revision": revision,
+            "backend": args.backend,
+            "seed": args.seed,
+            "days": args.days,
+            "repeat": args.repeat,
+            "created_at": stamp,
+            "results": results,
+        }, f, indent=2)
+    print(f"\n💾 Saved {path}")
+
+
+def compare(old_path, new_path):
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+
+    before = {(r["path"], r["students"]): r for r in old["results"]}
+    print(f"🔍 {old['revision']} ({old['backend']}) → {new['revision']} ({new['backend']})\n")
+    print(f"{'path':<28}{'students':>10}{'before':>12}{'after':>12}{'change':>10}{'stmts':>12}")
+    for r in new["results"]:
+        prev = before.get((r["path"], r["students"]))
+        if not prev:
+            continue
+        change = (r["median_ms"] - prev["median_ms"]) / prev["median_ms"] * 100 if prev["median_ms"] else 0.0
+        print(f"{r['path']:<28}{r['students']:>10,}{prev['median_ms']:>12.2f}{r['median_ms']:>12.2f}"
+              f"{change:>+9.0f}%{prev['statements']:>6}→{r['statements']:<5}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every dashboard query path")
+    parser.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite")
+    parser.add_argument("--sizes", default="1000,5000,20000", help="comma-separated student counts")
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--paths", help="comma-separated subset of query paths")
+    parser.add_argument("--load", action="store_true", help="mysql: truncate and reload the configured DB at each size")
+    parser.add_argument("--output", help="result file (default: bench_results/<time>-<rev>-<backend>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    paths = args.paths.split(",") if args.paths else list(QUERY_PATHS)
+    unknown = [p for p in paths if p not in QUERY_PATHS]
+    if unknown:
+        parser.error(f"unknown paths: {', '.join(unknown)}")
+
+    backend = SQLiteBackend() if args.backend == "sqlite" else MySQLBackend(load=args.load)
+    try:
+        if not backend.reloads:
+            sizes = [backend.execute("SELECT COUNT(*) FROM student_details")[0][0]]
+        results = benchmark(backend, sizes, args.repeat, args.seed, args.days, paths)
+    finally:
+        backend.close()
+
+    print_scaling(results, sizes)
+    save(results, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
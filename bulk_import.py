@@ -0,0 +1,361 @@
+# bulk_import.py - Streaming CSV/XLSX import of students, faculty and enrollments
+"""
+Reads an uploaded sheet row by row, validates it in chunks and inserts each
+chunk in one transaction, so memory stays bounded by the chunk size and a
+10k-row intake loads in seconds.
+
+Duplicate usernames and phone numbers are detected per chunk with one
+``IN (...)`` lookup against the database plus a running set for duplicates
+inside the file. Rows that fail are collected with their row number and
+reason instead of aborting the import.
+
+    python bulk_import.py students intake.csv
+    python bulk_import.py enrollments enrollments.xlsx
+
+XLSX files need the optional ``openpyxl`` package.
+"""
+import csv
+import io
+import os
+import sys
+import time
+
+import gpa
+from config import fetch_details, transaction
+
+CHUNK_SIZE = int(os.getenv("DB_IMPORT_CHUNK", "1000"))
+
+GENDERS = {"Male", "Female", "Other"}
+
+# Required columns first; the rest are optional
+COLUMNS = {
+    "students": (["name", "age", "sex", "phoneno", "username", "password"], ["email"]),
+    "faculty": (["name", "department", "phoneno", "username", "password"],
+                ["email", "qualification", "course", "subject", "year", "semester", "designation"]),
+    "enrollments": (["student_username", "faculty_username", "course"], []),
+}
+
+
+class ImportReport:
+    """Counts and per-row errors for one import"""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.rows = 0
+        self.inserted = 0
+        self.errors = []  # (row_number, message)
+        self.started = time.monotonic()
+
+    def fail(self, row_number, message):
+        self.errors.append((row_number, message))
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+
+# -------------------------------------------------------------
+# Readers
+# -------------------------------------------------------------
+def read_rows(stream, filename):
+    """Yield the cleaned header, then ``(row_number, {column: text})`` per row,
+    from a CSV or XLSX file object"""
+    if filename.lower().endswith((".xlsx", ".xlsm")):
+        yield from _read_xlsx(stream)
+    else:
+        yield from _read_csv(stream)
+
+
+def _clean_header(values):
+    return [str(v or "").strip().lower().replace(" ", "_") for v in values]
+
+
+def _read_csv(stream):
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+    header = _clean_header(next(reader, []))
+    yield header
+    for number, values in enumerate(reader, start=2):
+        if any(v.strip() for v in values):
+            yield number, {h: v.strip() for h, v in zip(header, values)}
+
+
+def _read_xlsx(stream):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError("Reading .xlsx files needs openpyxl (pip install openpyxl)")
+
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = _clean_header(next(rows, []))
+        yield header
+        for number, values in enumerate(rows, start=2):
+            values = ["" if v is None else str(v).strip() for v in values]
+            if any(values):
+                yield number, dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# -------------------------------------------------------------
+# Validation
+# -------------------------------------------------------------
+def missing_columns(kind, header):
+    required, _ = COLUMNS[kind]
+    return [c for c in required if c not in header]
+
+
+def _validate_person(kind, row):
+    """Return an error message, or None if the row is usable"""
+    required, _ = COLUMNS[kind]
+    empty = [c for c in required if not row.get(c)]
+    if empty:
+        return f"missing {', '.join(empty)}"
+    phone = row["phoneno"].replace(" ", "")
+    if not phone.lstrip("+").isdigit() or len(phone) > 15:
+        return f"invalid phone '{row['phoneno']}'"
+    row["phoneno"] = phone
+    if kind == "students":
+        try:
+            age = int(float(row["age"]))
+        except (ValueError, OverflowError):  # also "nan" / "inf"
+            return f"invalid age '{row['age']}'"
+        if not 5 <= age <= 60:
+            return f"age {age} out of range"
+        row["age"] = age
+        sex = row["sex"].capitalize()
+        if sex not in GENDERS:
+            return f"invalid sex '{row['sex']}'"
+        row["sex"] = sex
+    elif len(row["password"]) < 6:
+        return "password must be at least 6 characters"
+    return None
+
+
+def _existing(query, values):
+    """Return the subset of ``values`` found by ``query`` (one IN lookup)"""
+    values = sorted(set(values))
+    if not values:
+        return set()
+    marks = ", ".join(["%s"] * len(values))
+    rows = fetch_details(query.format(marks=marks), tuple(values))
+    if rows is None:
+        raise ConnectionError("Duplicate check failed")
+    return {r[0] for r in rows}
+
+
+def _screen(kind, chunk, report, seen_usernames, seen_phones, phone_table):
+    """Validate a chunk and drop rows that clash with the file or the database"""
+    valid = []
+    for number, row in chunk:
+        error = _validate_person(kind, row)
+        if error is None and row["username"] in seen_usernames:
+            error = f"username '{row['username']}' repeated in file"
+        if error is None and row["phoneno"] in seen_phones:
+            error = f"phone '{row['phoneno']}' repeated in file"
+        if error:
+            report.fail(number, error)
+            continue
+        seen_usernames.add(row["username"])
+        seen_phones.add(row["phoneno"])
+        valid.append((number, row))
+
+    taken_usernames = _existing("SELECT uname FROM login_details WHERE uname IN ({marks})",
+                                [r["username"] for _, r in valid])
+    taken_phones = _existing(f"SELECT phoneno FROM {phone_table} WHERE phoneno IN ({{marks}})",
+                             [r["phoneno"] for _, r in valid])
+    accepted = []
+    for number, row in valid:
+        if row["username"] in taken_usernames:
+            report.fail(number, f"username '{row['username']}' already exists")
+        elif row["phoneno"] in taken_phones:
+            report.fail(number, f"phone '{row['phoneno']}' already registered")
+        else:
+            accepted.append((number, row))
+    return accepted
+
+
+def _ids_by_phone(tx, table, phones):
+    marks = ", ".join(["%s"] * len(phones))
+    return dict((phone, id_) for id_, phone in tx.fetch(
+        f"SELECT id, phoneno FROM {table} WHERE phoneno IN ({marks})", tuple(phones)))
+
+
+# -------------------------------------------------------------
+# Loaders (one transaction per chunk)
+# -------------------------------------------------------------
+def _insert_students(tx, rows):
+    tx.execute_many(
+        "INSERT INTO student_details (name, age, sex, phoneno) VALUES (%s, %s, %s, %s)",
+        [(r["name"], r["age"], r["sex"], r["phoneno"]) for r in rows],
+    )
+    ids = _ids_by_phone(tx, "student_details", [r["phoneno"] for r in rows])
+    tx.execute_many(
+        "INSERT INTO login_details (uname, password, typeOfUser, email, phoneno, user_id) "
+        "VALUES (%s, %s, %s, %s, %s, %s)",
+        [(r["username"], r["password"], "student", r.get("email", ""), r["phoneno"], ids[r["phoneno"]])
+         for r in rows],
+    )
+
+
+def _insert_faculty(tx, rows):
+    tx.execute_many(
+        "INSERT INTO faculty_details (name, department, phoneno, qualification, email) VALUES (%s, %s, %s, %s, %s)",
+        [(r["name"], r["department"], r["phoneno"], r.get("qualification", ""), r.get("email") or None)
+         for r in rows],
+    )
+    ids = _ids_by_phone(tx, "faculty_details", [r["phoneno"] for r in rows])
+    tx.execute_many(
+        "INSERT INTO faculty_teaching (faculty_id, course, subject, year, semester, designation) "
+        "VALUES (%s, %s, %s, %s, %s, %s)",
+        [(ids[r["phoneno"]], r.get("course", ""), r.get("subject", ""), r.get("year", ""),
+          r.get("semester", ""), r.get("designation", ""))
+         for r in rows if r.get("course") or r.get("subject")],
+    )
+    tx.execute_many(
+        "INSERT INTO login_details (uname, password, typeOfUser, email, phoneno, user_id) "
+        "VALUES (%s, %s, %s, %s, %s, %s)",
+        [(r["username"], r["password"], "faculty", r.get("email", ""), r["phoneno"], ids[r["phoneno"]])
+         for r in rows],
+    )
+
+
+def _import_people(kind, chunks, report):
+    table = "student_details" if kind == "students" else "faculty_details"
+    insert = _insert_students if kind == "students" else _insert_faculty
+    seen_usernames, seen_phones = set(), set()
+    for chunk in chunks:
+        accepted = _screen(kind, chunk, report, seen_usernames, seen_phones, table)
+        if accepted:
+            try:
+                with transaction() as tx:
+                    insert(tx, [row for _, row in accepted])
+                report.inserted += len(accepted)
+            except Exception as e:
+                for number, _ in accepted:
+                    report.fail(number, f"not saved: {e}")
+        yield report
+
+
+def _import_enrollments(chunks, report):
+    for chunk in chunks:
+        valid = []
+        for number, row in chunk:
+            empty = [c for c in COLUMNS["enrollments"][0] if not row.get(c)]
+            if empty:
+                report.fail(number, f"missing {', '.join(empty)}")
+            else:
+                valid.append((number, row))
+        if not valid:
+            yield report
+            continue
+
+        reported = len(report.errors)
+        try:
+            with transaction() as tx:
+                usernames = sorted({r["student_username"] for _, r in valid} | {r["faculty_username"] for _, r in valid})
+                marks = ", ".join(["%s"] * len(usernames))
+                logins = {(uname, kind): user_id for uname, kind, user_id in tx.fetch(
+                    f"SELECT uname, typeOfUser, user_id FROM login_details WHERE uname IN ({marks})", tuple(usernames))}
+
+                resolved = []
+                for number, row in valid:
+                    student_id = logins.get((row["student_username"], "student"))
+                    faculty_id = logins.get((row["faculty_username"], "faculty"))
+                    if student_id is None:
+                        report.fail(number, f"unknown student '{row['student_username']}'")
+                    elif faculty_id is None:
+                        report.fail(number, f"unknown faculty '{row['faculty_username']}'")
+                    else:
+                        resolved.append((number, student_id, faculty_id, row["course"]))
+
+                existing = set()
+                if resolved:
+                    marks = ", ".join(["(%s, %s, %s)"] * len(resolved))
+                    existing = set(tx.fetch(
+                        f"SELECT student_id, faculty_id, course FROM results "
+                        f"WHERE (student_id, faculty_id, course) IN ({marks})",
+                        tuple(v for _, s, f, c in resolved for v in (s, f, c))))
+
+                new, pending = [], set()
+                for number, student_id, faculty_id, course in resolved:
+                    key = (student_id, faculty_id, course)
+                    if key in existing or key in pending:
+                        report.fail(number, f"'{course}' already assigned")
+                    else:
+                        pending.add(key)
+                        new.append(key)
+
+                tx.execute_many(
+                    "INSERT INTO results (student_id, faculty_id, course, grade) VALUES (%s, %s, %s, NULL)", new)
+                gpa.refresh(tx, [k[0] for k in new], [k[1] for k in new])
+            report.inserted += len(new)
+        except Exception as e:
+            failed = {number for number, _ in report.errors[reported:]}
+            for number, _ in valid:
+                if number not in failed:
+                    report.fail(number, f"not saved: {e}")
+        yield report
+
+
+def import_file(kind, stream, filename, chunk_size=None):
+    """Import ``stream``; yields the report after each chunk for progress display"""
+    if kind not in COLUMNS:
+        raise ValueError(f"Unknown import kind '{kind}'")
+    report = ImportReport(kind)
+
+    def counted(rows):
+        for item in rows:
+            report.rows += 1
+            yield item
+
+    rows = read_rows(stream, filename)
+    header = next(rows)
+    if not any(header):
+        yield report
+        return
+    missing = missing_columns(kind, header)
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+    chunks = _chunks(counted(rows), chunk_size or CHUNK_SIZE)
+    if kind == "enrollments":
+        yield from _import_enrollments(chunks, report)
+    else:
+        yield from _import_people(kind, chunks, report)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] not in COLUMNS:
+        print(f"Usage: python bulk_import.py {{{'|'.join(COLUMNS)}}} FILE")
+        sys.exit(2)
+    kind, path = sys.argv[1:]
+    report = None
+    try:
+        with open(path, "rb") as f:
+            for report in import_file(kind, f, path):
+                print(f"   {report.rows:,} rows read, {report.inserted:,} inserted, {len(report.errors):,} errors")
+    except (ValueError, ImportError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if report is None or report.rows == 0:
+        print("ℹ️ Nothing to import: the file has no data rows")
+        sys.exit(0)
+    print(f"✅ Imported {report.inserted:,} of {report.rows:,} {kind} rows in {report.elapsed:.1f}s")
+    for number, message in sorted(report.errors)[:50]:
+        print(f"   row {number}: {message}")
+    if len(report.errors) > 50:
+        print(f"   ... and {len(report.errors) - 50} more errors")
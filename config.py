@@ -1,91 +1,857 @@
-import mysql.connector
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv('.env')
-
-def get_db_config():
-    return {
-        "host": os.getenv("DB_HOST", "localhost"),
-        "user": os.getenv("DB_USER", "root"),
-        "password": os.getenv("DB_PASSWORD", ""),
-        "database": os.getenv("DB_NAME", "student_management"),
-        "port": int(os.getenv("DB_PORT", "3306")),
-    }
-
-def get_connection():
-    """Get local MySQL connection"""
-    try:
-        conn = mysql.connector.connect(**get_db_config())
-        return conn
-    except mysql.connector.Error as e:
-        print(f"❌ Local MySQL Error: {e}")
-        print("\n💡 Troubleshooting:")
-        print("1. Is MySQL running? (Run 'mysql' in terminal)")
-        print("2. Check .env file for correct password")
-        print("3. Try: sudo service mysql start (Linux/Mac)")
-        print("4. Try: net start mysql (Windows)")
-        return None
-
-def fetch_details(query, params=None):
-    """Execute SELECT query"""
-    conn = get_connection()
-    if not conn:
-        return None
-    
-    try:
-        cursor = conn.cursor()
-        cursor.execute(query, params or ())
-        result = cursor.fetchall()
-        return result
-    except Exception as e:
-        print(f"❌ Query Error: {e}")
-        return None
-    finally:
-        if conn and conn.is_connected():
-            cursor.close()
-            conn.close()
-
-def execute_query(query, params=None):
-    """Execute INSERT/UPDATE/DELETE query"""
-    conn = get_connection()
-    if not conn:
-        return False
-    
-    try:
-        cursor = conn.cursor()
-        cursor.execute(query, params or ())
-        conn.commit()
-        return True
-    except Exception as e:
-        print(f"❌ Query Error: {e}")
-        if conn and conn.is_connected():
-            conn.rollback()
-        return False
-    finally:
-        if conn and conn.is_connected():
-            cursor.close()
-            conn.close()
-
-# Test connection
-if __name__ == "__main__":
-    print("🔍 Testing local MySQL connection...")
-    conn = get_connection()
-    if conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT DATABASE()")
-        db = cursor.fetchone()[0]
-        print(f"✅ Connected to database: {db}")
-        
-        # Show tables
-        cursor.execute("SHOW TABLES")
-        tables = cursor.fetchall()
-        print(f"📊 Tables found: {len(tables)}")
-        for table in tables:
-            print(f"   - {table[0]}")
-        
-        cursor.close()
-        conn.close()
-    else:
-        print("❌ Could not connect to local MySQL")
\ No newline at end of file
+import contextvars
+import mysql.connector
+import numpy as np
+import os
+import pandas as pd
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dotenv import load_dotenv
+import query_cache
+import query_stats
+
+# Load environment variables
+load_dotenv('.env')
+
+def get_db_config():
+    return {
+        "host": os.getenv("DB_HOST", "localhost"),
+        "user": os.getenv("DB_USER", "root"),
+        "password": os.getenv("DB_PASSWORD", ""),
+        "database": os.getenv("DB_NAME", "student_management"),
+        "port": int(os.getenv("DB_PORT", "3306")),
+    }
+
+def get_pool_config():
+    return {
+        "size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+        "ping_after": float(os.getenv("DB_POOL_PING_AFTER", "30")),
+    }
+
+def get_replica_config():
+    """Connection settings for the read replica, or None if none is configured"""
+    host = os.getenv("DB_REPLICA_HOST")
+    if not host:
+        return None
+    primary = get_db_config()
+    return {
+        "host": host,
+        "user": os.getenv("DB_REPLICA_USER", primary["user"]),
+        "password": os.getenv("DB_REPLICA_PASSWORD", primary["password"]),
+        "database": os.getenv("DB_REPLICA_NAME", primary["database"]),
+        "port": int(os.getenv("DB_REPLICA_PORT", str(primary["port"]))),
+    }
+
+def get_replica_routing_config():
+    return {
+        "max_lag": float(os.getenv("DB_REPLICA_MAX_LAG", "5")),
+        "check_every": float(os.getenv("DB_REPLICA_LAG_CHECK", "5")),
+        "retry_after": float(os.getenv("DB_REPLICA_RETRY", "30")),
+    }
+
+def get_batch_size():
+    """Rows sent per executemany() call by the bulk write helpers"""
+    return int(os.getenv("DB_BATCH_SIZE", "500"))
+
+def get_fanout_workers():
+    """Threads used by run_parallel(); capped by the pool size"""
+    return min(int(os.getenv("DB_FANOUT_WORKERS", "8")), get_pool_config()["size"])
+
+def get_stream_chunk_size():
+    """Rows fetched per round trip by the streaming read helpers"""
+    return int(os.getenv("DB_STREAM_CHUNK", "1000"))
+
+def get_connection():
+    """Get local MySQL connection"""
+    try:
+        conn = mysql.connector.connect(**get_db_config())
+        return conn
+    except mysql.connector.Error as e:
+        print(f"❌ Local MySQL Error: {e}")
+        print("\n💡 Troubleshooting:")
+        print("1. Is MySQL running? (Run 'mysql' in terminal)")
+        print("2. Check .env file for correct password")
+        print("3. Try: sudo service mysql start (Linux/Mac)")
+        print("4. Try: net start mysql (Windows)")
+        return None
+
+def get_replica_connection():
+    """Get a connection to the read replica"""
+    try:
+        return mysql.connector.connect(**get_replica_config())
+    except mysql.connector.Error as e:
+        print(f"⚠️ Replica MySQL Error: {e}")
+        return None
+
+
+# -------------------------------------------------------------
+# Connection Pool
+# -------------------------------------------------------------
+class ConnectionPool:
+    """Process-wide pool of MySQL connections shared by all sessions.
+
+    Connections are opened lazily up to ``size``. A borrower waits at most
+    ``timeout`` seconds for a free connection. Idle connections older than
+    ``max_idle`` seconds are closed, and connections idle for more than
+    ``ping_after`` seconds are pinged before being handed out.
+    """
+
+    def __init__(self, connect, size=10, timeout=10.0, max_idle=300.0, ping_after=30.0):
+        self._connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.ping_after = ping_after
+
+        self._cond = threading.Condition()
+        self._idle = []  # list of (conn, returned_at)
+        self._open = 0
+        self._in_use = 0
+        self._waiters = 0
+
+        self._borrows = 0
+        self._timeouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def acquire(self):
+        """Borrow a connection, or return None if none is available in time"""
+        started = time.monotonic()
+        deadline = started + self.timeout
+
+        timed_out = False
+        with self._cond:
+            stale = self._reap_idle()
+            self._waiters += 1
+            while not self._idle and self._open >= self.size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    timed_out = True
+                    self._timeouts += 1
+                    break
+                self._cond.wait(remaining)
+            self._waiters -= 1
+
+            if not timed_out:
+                if self._idle:
+                    conn, returned_at = self._idle.pop()
+                else:
+                    conn, returned_at = None, None
+                    self._open += 1
+                self._in_use += 1
+
+        # Network work happens outside the lock
+        for old in stale:
+            self._close_quietly(old)
+        if timed_out:
+            print(f"❌ Pool Error: no connection available after {self.timeout:.1f}s")
+            return None
+        if conn is not None and not self._is_healthy(conn, returned_at):
+            self._close_quietly(conn)
+            conn = None
+            with self._cond:
+                self._discarded += 1
+        if conn is None:
+            conn = self._connect()
+            if conn is None:
+                with self._cond:
+                    self._open -= 1
+                    self._in_use -= 1
+                    self._cond.notify()
+                return None
+            with self._cond:
+                self._created += 1
+
+        waited = time.monotonic() - started
+        with self._cond:
+            self._borrows += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        return conn
+
+    def release(self, conn, discard=False):
+        """Return a borrowed connection to the pool"""
+        if not discard:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except Exception:
+                discard = True
+
+        if discard:
+            self._close_quietly(conn)
+
+        with self._cond:
+            self._in_use -= 1
+            if discard:
+                self._open -= 1
+                self._discarded += 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def close_all(self):
+        """Close every idle connection"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self):
+        """Snapshot of pool usage for tuning"""
+        with self._cond:
+            return {
+                "size": self.size,
+                "open": self._open,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiters": self._waiters,
+                "borrows": self._borrows,
+                "timeouts": self._timeouts,
+                "created": self._created,
+                "discarded": self._discarded,
+                "avg_wait_ms": (self._wait_total / self._borrows * 1000) if self._borrows else 0.0,
+                "max_wait_ms": self._wait_max * 1000,
+            }
+
+    def _reap_idle(self):
+        # Caller holds the lock; returns the stale connections to close
+        now = time.monotonic()
+        keep, stale = [], []
+        for conn, returned_at in self._idle:
+            if now - returned_at > self.max_idle:
+                stale.append(conn)
+            else:
+                keep.append((conn, returned_at))
+        self._idle = keep
+        self._open -= len(stale)
+        self._discarded += len(stale)
+        return stale
+
+    def _is_healthy(self, conn, returned_at):
+        if time.monotonic() - returned_at < self.ping_after:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """Return the process-wide connection pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(get_connection, **get_pool_config())
+    return _pool
+
+def get_pool_stats():
+    """Return in-use, waiter and wait-time counters for the pool"""
+    return get_pool().stats()
+
+@contextmanager
+def pooled_connection(pool=None):
+    """Borrow a pooled connection for the duration of a ``with`` block.
+
+    Yields None when the database is unreachable. Connections that raised a
+    connection-level driver error are dropped instead of being returned.
+    """
+    pool = pool or get_pool()
+    conn = pool.acquire()
+    if conn is None:
+        yield None
+        return
+
+    broken = False
+    try:
+        yield conn
+    except (mysql.connector.errors.InterfaceError, mysql.connector.errors.OperationalError):
+        broken = True
+        raise
+    finally:
+        pool.release(conn, discard=broken)
+
+
+# -------------------------------------------------------------
+# Read Replica
+# -------------------------------------------------------------
+_replica_pool = None
+_session = contextvars.ContextVar("db_session", default=None)
+
+# Driver errors meaning the replica itself is unreachable, not that the query is bad
+REPLICA_CONNECTION_ERRORS = (mysql.connector.errors.InterfaceError, mysql.connector.errors.OperationalError)
+
+def get_replica_pool():
+    """Return the replica connection pool, or None if no replica is configured"""
+    global _replica_pool
+    if _replica_pool is None and get_replica_config() is not None:
+        with _pool_lock:
+            if _replica_pool is None:
+                _replica_pool = ConnectionPool(get_replica_connection, **get_pool_config())
+    return _replica_pool
+
+def bind_session(key):
+    """Attribute this rerun's writes to ``key`` (e.g. the username) for read-your-writes"""
+    _session.set(key)
+
+def note_write():
+    """Record that the current session just committed a write"""
+    get_router().note_write(_session.get())
+
+
+class ReplicaRouter:
+    """Decides whether a read-only query may be served by the replica.
+
+    The replica is used only while its measured lag (``SHOW REPLICA
+    STATUS``, re-checked every ``check_every`` seconds) is within
+    ``max_lag``, and not for a session whose last write is newer than that
+    lag, so a user always reads what they just saved. Writes made outside
+    any session (CLIs, background jobs) hold back every session. After a
+    replica failure reads go to the primary for ``retry_after`` seconds.
+    """
+
+    def __init__(self, max_lag=5.0, check_every=5.0, retry_after=30.0):
+        self.max_lag = max_lag
+        self.check_every = check_every
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._lag = None
+        self._checked_at = None
+        self._down_until = 0.0
+        self._last_write = {}  # session key -> monotonic time of last commit
+        self._replica_reads = 0
+        self._primary_reads = 0
+        self._failures = 0
+
+    def note_write(self, session):
+        now = time.monotonic()
+        with self._lock:
+            # A write older than max_lag (+1s) can no longer hold a session back
+            self._last_write = {key: written for key, written in self._last_write.items()
+                                if now - written <= self.max_lag + 1}
+            self._last_write[session] = now
+
+    def mark_failed(self):
+        with self._lock:
+            self._failures += 1
+            self._down_until = time.monotonic() + self.retry_after
+            self._checked_at = None
+
+    def use_replica(self, session):
+        """True if a read for ``session`` may go to the replica right now"""
+        if get_replica_pool() is None:
+            return False
+        now = time.monotonic()
+        lag = self._current_lag(now)
+        with self._lock:
+            allowed = lag is not None and lag <= self.max_lag and now >= self._down_until
+            if allowed:
+                # Writes newer than the lag (+1s for its whole-second resolution) may not be visible yet
+                for key in (session, None):
+                    written = self._last_write.get(key)
+                    if written is not None and now - written <= lag + 1:
+                        allowed = False
+            if allowed:
+                self._replica_reads += 1
+            else:
+                self._primary_reads += 1
+            return allowed
+
+    def _current_lag(self, now):
+        with self._lock:
+            if now < self._down_until:
+                return None
+            if self._checked_at is not None and now - self._checked_at < self.check_every:
+                return self._lag
+            # Claim the check so concurrent readers reuse the old value meanwhile
+            self._checked_at = now
+
+        lag = self._measure_lag()
+        with self._lock:
+            self._lag = lag
+        if lag is None:
+            self.mark_failed()
+        return lag
+
+    @staticmethod
+    def _measure_lag():
+        """Seconds the replica is behind, or None if unknown (unreachable or not replicating)"""
+        try:
+            with pooled_connection(get_replica_pool()) as conn:
+                if not conn:
+                    return None
+                cursor = conn.cursor()
+                try:
+                    try:
+                        cursor.execute("SHOW REPLICA STATUS")
+                    except mysql.connector.Error:
+                        cursor.execute("SHOW SLAVE STATUS")  # MySQL < 8.0.22
+                    row = cursor.fetchone()
+                    if row is None:
+                        print("⚠️ Replica reports no replication status; reading from the primary")
+                        return None
+                    status = dict(zip([d[0] for d in cursor.description], row))
+                finally:
+                    cursor.close()
+        except Exception as e:
+            print(f"⚠️ Replica lag check failed: {e}")
+            return None
+        lag = status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+        return None if lag is None else float(lag)
+
+    def stats(self):
+        with self._lock:
+            total = self._replica_reads + self._primary_reads
+            return {
+                "configured": get_replica_pool() is not None,
+                "lag_seconds": self._lag,
+                "max_lag": self.max_lag,
+                "available": self._lag is not None and time.monotonic() >= self._down_until,
+                "replica_reads": self._replica_reads,
+                "primary_reads": self._primary_reads,
+                "replica_share": self._replica_reads / total if total else 0.0,
+                "failures": self._failures,
+            }
+
+
+_router = None
+
+def get_router():
+    global _router
+    if _router is None:
+        with _pool_lock:
+            if _router is None:
+                _router = ReplicaRouter(**get_replica_routing_config())
+    return _router
+
+def get_replica_stats():
+    """Return lag and routing counters for the read replica"""
+    return get_router().stats()
+
+def _read_pool(read_only):
+    """Replica pool if this read may use it, else None (the primary)"""
+    if read_only and get_router().use_replica(_session.get()):
+        return get_replica_pool()
+    return None
+
+
+def fetch_details(query, params=None, read_only=False):
+    """Execute SELECT query.
+
+    ``read_only`` marks report/analytics reads that may be served by the
+    read replica; they fall back to the primary if it cannot be reached.
+    """
+    try:
+        return _read(query, params, read_only)[0]
+    except Exception as e:
+        print(f"❌ Query Error: {e}")
+        return None
+
+def _read(query, params, read_only):
+    """Return ``(rows, from_replica)``; only connection failures fall back to the primary"""
+    replica = _read_pool(read_only)
+    if replica is not None:
+        try:
+            return _fetch_from(replica, query, params), True
+        except (ConnectionError,) + REPLICA_CONNECTION_ERRORS as e:
+            print(f"⚠️ Replica unavailable, reading from primary: {e}")
+            get_router().mark_failed()
+    return _fetch_from(None, query, params), False
+
+def _fetch_from(pool, query, params):
+    acquire_started = time.perf_counter()
+    with pooled_connection(pool) as conn:
+        acquire_ms = (time.perf_counter() - acquire_started) * 1000
+        if not conn:
+            raise ConnectionError("Database connection unavailable")
+
+        cursor = conn.cursor()
+        try:
+            with query_stats.timed(query, acquire_ms) as timing:
+                cursor.execute(query, params or ())
+                result = cursor.fetchall()
+                timing["rows"] = len(result)
+            return result
+        finally:
+            cursor.close()
+
+def fetch_cached(query, params=None, ttl=None, read_only=False):
+    """Execute SELECT query through the shared result cache.
+
+    Use for reads that every rerun repeats (counts, totals, pick lists).
+    Entries are dropped when a write through this module touches one of the
+    tables the query reads, and expire after ``ttl`` seconds regardless.
+    Rows served by the replica are returned but never cached, since they
+    may predate a write the cache has already seen.
+    """
+    tables = query_cache.tables_in(query)
+    if not query_cache.ENABLED or not tables:
+        return fetch_details(query, params, read_only)
+
+    cache = query_cache.get_cache()
+    key = (query, tuple(params or ()))
+    rows = cache.get(key)
+    if rows is not None:
+        return list(rows)
+
+    versions = cache.versions(tables)
+    try:
+        rows, from_replica = _read(query, params, read_only)
+    except Exception as e:
+        print(f"❌ Query Error: {e}")
+        return None
+    if not from_replica:
+        cache.put(key, tables, tuple(rows), versions, ttl)
+    return rows
+
+# -------------------------------------------------------------
+# Parallel reads
+# -------------------------------------------------------------
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=get_fanout_workers(),
+                                               thread_name_prefix="db-fanout")
+    return _executor
+
+def run_parallel(calls):
+    """Run independent zero-argument read calls concurrently; results in order.
+
+    Each call runs on a shared worker thread in a copy of the caller's
+    context, so per-rerun tracing still attributes its queries to the page.
+    Every call borrows its own pooled connection, so a page waits roughly
+    as long as its slowest query. Exceptions are re-raised in the caller.
+    Never pass anything that writes or uses Streamlit.
+    """
+    calls = list(calls)
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    executor = _get_executor()
+    futures = [executor.submit(contextvars.copy_context().run, call) for call in calls]
+    return [future.result() for future in futures]
+
+def fetch_parallel(queries):
+    """``fetch_details`` for several ``(query, params)`` pairs at once"""
+    return run_parallel([lambda q=query, p=params: fetch_details(q, p) for query, params in queries])
+
+# -------------------------------------------------------------
+# Streaming reads
+# -------------------------------------------------------------
+def stream_chunks(query, params=None, size=None, read_only=False):
+    """Yield lists of up to ``size`` rows from an unbuffered SELECT.
+
+    Rows are pulled from the server one chunk at a time, so a result of any
+    size is processed in constant memory. The pooled connection is held
+    from the first ``next()`` until the generator is exhausted or closed;
+    if the consumer stops early the connection still has unread rows on
+    the wire and is discarded instead of being returned to the pool. Use
+    ``contextlib.closing`` when the loop may be left early::
+
+        with closing(stream_rows("SELECT ... FROM attendance")) as rows:
+            for row in rows:
+                ...
+
+    ``read_only`` streams may be served by the read replica; they fall back
+    to the primary if it fails before the first row.
+
+    Raises ConnectionError if the database is unreachable.
+    """
+    size = size or get_stream_chunk_size()
+    pool, conn = _read_pool(read_only), None
+    if pool is not None:
+        acquire_started = time.perf_counter()
+        conn = pool.acquire()
+        if conn is None:
+            get_router().mark_failed()
+    if conn is None:
+        pool = get_pool()
+        acquire_started = time.perf_counter()
+        conn = pool.acquire()
+    acquire_ms = (time.perf_counter() - acquire_started) * 1000
+    if conn is None:
+        raise ConnectionError("Database connection unavailable")
+
+    finished = False
+    cursor = conn.cursor(buffered=False)
+    try:
+        with query_stats.timed(query, acquire_ms) as timing:
+            try:
+                cursor.execute(query, params or ())
+            except REPLICA_CONNECTION_ERRORS:
+                if pool is get_pool():
+                    raise
+                # Replica failed before any rows were sent; retry on the primary
+                get_router().mark_failed()
+                cursor.close()
+                pool.release(conn, discard=True)
+                conn = None  # released; only a connection still held is released below
+                fallback = get_pool().acquire()
+                if fallback is None:
+                    raise ConnectionError("Database connection unavailable")
+                pool, conn = get_pool(), fallback
+                cursor = conn.cursor(buffered=False)
+                cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(size)
+                if not rows:
+                    break
+                timing["rows"] += len(rows)
+                yield rows
+        finished = True
+    finally:
+        if conn is not None:
+            try:
+                cursor.close()
+            except Exception:
+                finished = False
+            pool.release(conn, discard=not finished)
+
+def stream_rows(query, params=None, size=None, read_only=False):
+    """Yield the rows of a SELECT one at a time; see ``stream_chunks``"""
+    chunks = stream_chunks(query, params, size, read_only)
+    try:
+        for chunk in chunks:
+            yield from chunk
+    finally:
+        chunks.close()
+
+# -------------------------------------------------------------
+# Columnar reads
+# -------------------------------------------------------------
+COLUMN_TYPES = ("str", "int", "float", "date")
+
+def _column_part(values, kind):
+    """Convert one chunk of one column to a NumPy array (plus NULL mask for ints)"""
+    count = len(values)
+    if kind == "float":
+        return np.fromiter((np.nan if v is None else float(v) for v in values), dtype="float64", count=count)
+    if kind == "int":
+        return (np.fromiter((0 if v is None else int(v) for v in values), dtype="int64", count=count),
+                np.fromiter((v is None for v in values), dtype=bool, count=count))
+    if kind == "date":
+        return np.array(values, dtype="datetime64[ns]")
+    return np.array(values, dtype=object)
+
+def _frame_from_chunks(chunks, columns):
+    parts = [[] for _ in columns]
+    for chunk in chunks:
+        for i, values in enumerate(zip(*chunk)):
+            parts[i].append(_column_part(values, columns[i][1]))
+
+    data = {}
+    for (name, kind), column in zip(columns, parts):
+        if kind == "int":
+            values = np.concatenate([v for v, _ in column]) if column else np.empty(0, dtype="int64")
+            mask = np.concatenate([m for _, m in column]) if column else np.empty(0, dtype=bool)
+            data[name] = pd.arrays.IntegerArray(values, mask)
+        elif column:
+            data[name] = np.concatenate(column)
+        else:
+            data[name] = np.empty(0, dtype={"float": "float64", "date": "datetime64[ns]"}.get(kind, object))
+    return pd.DataFrame(data, copy=False)
+
+def rows_to_frame(rows, columns):
+    """Build a typed DataFrame from already fetched rows (e.g. ``fetch_cached``)"""
+    return _frame_from_chunks([rows] if rows else [], columns)
+
+def fetch_dataframe(query, columns, params=None, size=None, read_only=False):
+    """Execute SELECT query straight into a typed pandas DataFrame.
+
+    ``columns`` is a list of ``(name, type)`` pairs with type one of
+    ``COLUMN_TYPES``: DECIMAL becomes float64, DATE/DATETIME become
+    datetime64 and integers keep NULLs as ``pd.NA``. Rows are streamed in
+    chunks and converted column by column, so the full result never exists
+    as Python tuples. ``read_only`` is passed to ``stream_chunks``.
+    Returns None if the query failed.
+    """
+    try:
+        chunks = stream_chunks(query, params, size, read_only)
+        try:
+            return _frame_from_chunks(chunks, columns)
+        finally:
+            chunks.close()
+    except Exception as e:
+        print(f"❌ Query Error: {e}")
+        return None
+
+def execute_query(query, params=None):
+    """Execute INSERT/UPDATE/DELETE query"""
+    try:
+        acquire_started = time.perf_counter()
+        with pooled_connection() as conn:
+            acquire_ms = (time.perf_counter() - acquire_started) * 1000
+            if not conn:
+                return False
+
+            # Uncommitted work is rolled back when the connection is released
+            cursor = conn.cursor()
+            try:
+                with query_stats.timed(query, acquire_ms) as timing:
+                    cursor.execute(query, params or ())
+                    conn.commit()
+                    timing["rows"] = max(cursor.rowcount, 0)
+                note_write()
+                query_cache.invalidate_tables(query_cache.tables_in(query))
+                return True
+            finally:
+                cursor.close()
+    except Exception as e:
+        print(f"❌ Query Error: {e}")
+        return False
+
+# -------------------------------------------------------------
+# Transactions
+# -------------------------------------------------------------
+class Transaction:
+    """Statements that run on one connection and are committed together"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.lastrowid = None
+        self.tables = set()  # written tables, invalidated in the cache on commit
+
+    def execute(self, query, params=None):
+        """Run an INSERT/UPDATE/DELETE and return the affected row count"""
+        self.tables |= query_cache.tables_in(query)
+        cursor = self._conn.cursor()
+        try:
+            with query_stats.timed(query) as timing:
+                cursor.execute(query, params or ())
+                timing["rows"] = max(cursor.rowcount, 0)
+            self.lastrowid = cursor.lastrowid
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    def execute_many(self, query, seq_params, batch_size=None):
+        """Run one statement for many parameter rows, in chunks.
+
+        ``seq_params`` may be any iterable, so large inputs are never held in
+        memory all at once. For ``INSERT ... VALUES`` statements (including
+        ``ON DUPLICATE KEY UPDATE``) the driver sends each chunk as a single
+        multi-row INSERT. Returns the total affected row count.
+        """
+        batch_size = batch_size or get_batch_size()
+        self.tables |= query_cache.tables_in(query)
+        cursor = self._conn.cursor()
+        total = 0
+        try:
+            batch = []
+            for params in seq_params:
+                batch.append(params)
+                if len(batch) >= batch_size:
+                    total += self._send_batch(cursor, query, batch)
+                    batch = []
+            if batch:
+                total += self._send_batch(cursor, query, batch)
+            return total
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _send_batch(cursor, query, batch):
+        with query_stats.timed(query) as timing:
+            cursor.executemany(query, batch)
+            timing["rows"] = max(cursor.rowcount, 0)
+        return timing["rows"]
+
+    def fetch(self, query, params=None):
+        """Run a SELECT inside the transaction and return all rows"""
+        cursor = self._conn.cursor()
+        try:
+            with query_stats.timed(query) as timing:
+                cursor.execute(query, params or ())
+                rows = cursor.fetchall()
+                timing["rows"] = len(rows)
+            return rows
+        finally:
+            cursor.close()
+
+
+@contextmanager
+def transaction():
+    """Group several statements into one unit of work.
+
+    Commits once when the ``with`` block exits normally and rolls back if
+    anything inside it raises, so callers never leave partial state behind::
+
+        with transaction() as tx:
+            tx.execute("INSERT INTO student_details ...", (...))
+            tx.execute("INSERT INTO login_details ...", (..., tx.lastrowid))
+    """
+    with pooled_connection() as conn:
+        if not conn:
+            raise ConnectionError("Database connection unavailable")
+
+        conn.start_transaction()
+        tx = Transaction(conn)
+        try:
+            yield tx
+            conn.commit()
+            if tx.tables:
+                note_write()
+            query_cache.invalidate_tables(tx.tables)
+        except Exception:
+            try:
+                conn.rollback()
+            except mysql.connector.Error:
+                pass
+            raise
+
+def execute_many(query, seq_params, batch_size=None):
+    """Execute INSERT/UPDATE/DELETE for many rows with a single commit"""
+    try:
+        with transaction() as tx:
+            tx.execute_many(query, seq_params, batch_size)
+        return True
+    except Exception as e:
+        print(f"❌ Bulk Query Error: {e}")
+        return False
+
+# Test connection
+if __name__ == "__main__":
+    print("🔍 Testing local MySQL connection...")
+    conn = get_connection()
+    if conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT DATABASE()")
+        db = cursor.fetchone()[0]
+        print(f"✅ Connected to database: {db}")
+
+        # Show tables
+        cursor.execute("SHOW TABLES")
+        tables = cursor.fetchall()
+        print(f"📊 Tables found: {len(tables)}")
+        for table in tables:
+            print(f"   - {table[0]}")
+
+        cursor.close()
+        conn.close()
+        print(f"🔌 Pool settings: {get_pool_config()}")
+        print(f"🗃️ Result cache: {query_cache.stats()}")
+        print(f"🐢 Slow query threshold: {query_stats.SLOW_QUERY_MS:.0f} ms (log: {query_stats.LOG_DIR})")
+    else:
+        print("❌ Could not connect to local MySQL")
@@ -0,0 +1,187 @@
+# exports.py - Streaming CSV/Parquet export of the report tables
+"""
+Each report is read with ``config.stream_chunks`` in chunks of
+``DB_EXPORT_CHUNK`` rows and written straight to a file, so exporting the
+full attendance history never holds more than one chunk in memory. Exports
+are read from the replica when one is configured:
+
+    path = exports.export("attendance", "csv")
+    path = exports.export("faculty_performance", "csv", filters={"department": "B.Tech"})
+
+    python exports.py attendance attendance.parquet
+
+Downloads from the dashboard hold the whole file in the Streamlit worker,
+so the admin page only offers reports of up to ``DB_EXPORT_DOWNLOAD_ROWS``
+rows and points larger ones at the command line.
+
+Parquet output needs the optional ``pyarrow`` package.
+"""
+import csv
+import datetime
+import os
+import sys
+import tempfile
+import time
+from decimal import Decimal
+
+from config import fetch_details, stream_chunks
+
+CHUNK_SIZE = int(os.getenv("DB_EXPORT_CHUNK", "10000"))
+MAX_DOWNLOAD_ROWS = int(os.getenv("DB_EXPORT_DOWNLOAD_ROWS", "100000"))
+
+FORMATS = ("csv", "parquet")
+
+# name -> (label, query, [(column, type)]); types drive Parquet schemas
+REPORTS = {
+    "grades": ("Grades", """
+        SELECT s.name, r.course, r.grade, f.name
+        FROM results r
+        JOIN student_details s ON r.student_id = s.id
+        JOIN faculty_details f ON r.faculty_id = f.id
+        WHERE r.course IS NOT NULL AND TRIM(r.course) != ''
+        ORDER BY s.name, r.course
+    """, [("Student", "str"), ("Course", "str"), ("Grade", "str"), ("Faculty", "str")]),
+    "attendance": ("Attendance", """
+        SELECT student_name, date, status FROM attendance ORDER BY date DESC
+    """, [("Student", "str"), ("Date", "date"), ("Status", "str")]),
+    "fees": ("Fees", """
+        SELECT student_name, fee_type, amount, due_date, status FROM fees ORDER BY due_date DESC
+    """, [("Student", "str"), ("Fee Type", "str"), ("Amount", "float"), ("Due Date", "date"),
+          ("Status", "str")]),
+    "gpa": ("Student GPA", """
+        SELECT s.name, g.graded_courses, g.gpa
+        FROM student_gpa g
+        JOIN student_details s ON s.id = g.student_id
+        WHERE g.gpa IS NOT NULL
+        ORDER BY g.gpa DESC
+    """, [("Student", "str"), ("Graded Courses", "int"), ("GPA", "float")]),
+    "faculty_performance": ("Faculty Performance", """
+        SELECT f.name, f.department,
+               COALESCE(g.students, 0), COALESCE(g.courses, 0), g.gpa
+        FROM faculty_details f
+        LEFT JOIN faculty_gpa g ON g.faculty_id = f.id
+        {where}
+        ORDER BY f.department, f.name
+    """, [("Faculty", "str"), ("Department", "str"), ("Students", "int"), ("Courses", "int"),
+          ("Avg GPA", "float")]),
+}
+
+# name -> {filter: column}; the filters a report's ``{where}`` slot accepts
+FILTERS = {
+    "faculty_performance": {"department": "f.department"},
+}
+
+
+def report_query(name, filters=None):
+    """Return the SQL and params for report ``name`` narrowed by ``{filter: value}``"""
+    if name not in REPORTS:
+        raise ValueError(f"Unknown report '{name}'")
+    filters = filters or {}
+    allowed = FILTERS.get(name, {})
+    unknown = [f for f in filters if f not in allowed]
+    if unknown:
+        raise ValueError(f"Report '{name}' cannot be filtered by {', '.join(unknown)}")
+    query = REPORTS[name][1]
+    if name in FILTERS:
+        clauses = [f"{allowed[f]} = %s" for f in filters]
+        query = query.format(where=f"WHERE {' AND '.join(clauses)}" if clauses else "")
+    return query, tuple(filters.values())
+
+
+def count_rows(name, filters=None):
+    """Number of rows report ``name`` would export, or None if the count failed"""
+    query, params = report_query(name, filters)
+    rows = fetch_details(f"SELECT COUNT(*) FROM ({query}) AS report", params, read_only=True)
+    return rows[0][0] if rows else None
+
+
+def _cell(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+# -------------------------------------------------------------
+# Writers
+# -------------------------------------------------------------
+def _write_csv(chunks, columns, path):
+    rows = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([name for name, _ in columns])
+        for chunk in chunks:
+            writer.writerows(chunk)
+            rows += len(chunk)
+    return rows
+
+
+def _arrow_schema(pa, columns):
+    types = {"str": pa.string(), "int": pa.int64(), "float": pa.float64(), "date": pa.date32()}
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+def _write_parquet(chunks, columns, path):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export needs pyarrow (pip install pyarrow)")
+
+    schema = _arrow_schema(pa, columns)
+    rows = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in chunks:
+            arrays = [
+                pa.array([_cell(row[i]) for row in chunk], type=field.type)
+                for i, field in enumerate(schema)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            rows += len(chunk)
+    return rows
+
+
+def write_report(name, fmt, path, chunk_size=None, filters=None):
+    """Stream report ``name`` to ``path``; returns the number of rows written"""
+    query, params = report_query(name, filters)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'")
+    columns = REPORTS[name][2]
+    chunks = stream_chunks(query, params, size=chunk_size or CHUNK_SIZE, read_only=True)
+    try:
+        if fmt == "parquet":
+            return _write_parquet(chunks, columns, path)
+        return _write_csv(chunks, columns, path)
+    finally:
+        chunks.close()
+
+
+def export(name, fmt="csv", directory=None, filters=None):
+    """Write report ``name`` to a new temporary file and return its path"""
+    fd, path = tempfile.mkstemp(prefix=f"{name}_", suffix=f".{fmt}", dir=directory)
+    os.close(fd)
+    try:
+        write_report(name, fmt, path, filters=filters)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+def file_name(name, fmt):
+    """Download name for a report, e.g. ``attendance_2024-05-01.csv``"""
+    return f"{name}_{datetime.date.today().isoformat()}.{fmt}"
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] not in REPORTS:
+        print(f"Usage: python exports.py {{{'|'.join(REPORTS)}}} FILE.csv|FILE.parquet")
+        sys.exit(2)
+    name, path = sys.argv[1:]
+    fmt = "parquet" if path.lower().endswith(".parquet") else "csv"
+    started = time.monotonic()
+    try:
+        rows = write_report(name, fmt, path)
+    except Exception as e:
+        print(f"❌ Export failed: {e}")
+        sys.exit(1)
+    print(f"✅ Exported {rows:,} {name} rows to {path} in {time.monotonic() - started:.1f}s")
@@ -0,0 +1,298 @@
+# generate_data.py - Deterministic institution-scale test data
+"""
+Populate every table with realistic, reproducible data so performance
+changes can be measured against the same dataset.
+
+    python generate_data.py --reset --students 20000 --faculty 600 --days 180 --seed 42
+
+Students are spread over the departments and courses in
+``subject_config.DEPARTMENT_COURSES``; every course subject gets at least
+one faculty member, and each student is enrolled with the faculty teaching
+their course's subjects. Attendance covers each weekday in the window, and
+fees follow a per-semester schedule. The same seed always produces the
+same rows.
+
+Rows are produced lazily and written with multi-row INSERTs, committed
+every ``--commit-every`` rows, so millions of attendance rows load in
+bounded memory.
+"""
+import argparse
+import datetime
+import random
+import sys
+import time
+
+import gpa
+import rollups
+import subject_config
+from config import Transaction, get_batch_size, get_connection
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Akash", "Ananya", "Arjun", "Diya", "Ishaan", "Kavya", "Krishna", "Meera",
+    "Neha", "Nikhil", "Priya", "Rahul", "Riya", "Rohan", "Sahil", "Saanvi", "Sneha", "Tanvi",
+    "Varun", "Vivek", "Yash", "Zara", "Aman", "Pooja", "Karan", "Simran", "Harsh", "Nisha",
+    "Manish", "Shreya", "Gaurav", "Anjali", "Deepak", "Kiran", "Sunil", "Lakshmi", "Rakesh", "Divya",
+]
+LAST_NAMES = [
+    "Sharma", "Verma", "Gupta", "Singh", "Kumar", "Patel", "Reddy", "Iyer", "Nair", "Das",
+    "Mehta", "Joshi", "Chopra", "Bose", "Rao", "Mishra", "Agarwal", "Pandey", "Saxena", "Kapoor",
+]
+DEPARTMENT_WEIGHTS = {"B.Tech": 0.6, "MBA": 0.25, "Pharmacy": 0.15}
+GRADE_WEIGHTS = {
+    "A+": 5, "A": 12, "A-": 12, "B+": 15, "B": 17, "B-": 12,
+    "C+": 9, "C": 7, "C-": 4, "D+": 2, "D": 3, "F": 2,
+}
+QUALIFICATIONS = ["Ph.D", "M.Tech", "M.Pharm", "MBA", "M.Sc"]
+DESIGNATIONS = ["Professor", "Associate Professor", "Assistant Professor", "Lecturer"]
+FEE_SCHEDULE = [("Tuition", 45000, 1.0), ("Exam", 2500, 1.0), ("Library", 1500, 0.6),
+                ("Hostel", 30000, 0.35), ("Transport", 8000, 0.25)]
+
+# Insert order respects foreign keys; reset runs in reverse
+TABLES = ["student_details", "faculty_details", "faculty_teaching", "login_details",
+          "results", "attendance", "fees"]
+
+
+def _rng(seed, table):
+    """Independent stream per table so output does not depend on load order"""
+    return random.Random(f"{seed}:{table}")
+
+
+def _ordinal(n):
+    return f"{n}{ {1: 'st', 2: 'nd', 3: 'rd'}.get(n, 'th') }"
+
+
+def _weighted(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def build_catalog():
+    """Flatten DEPARTMENT_COURSES into (department, course, [subjects])"""
+    return [
+        (department, course, subjects)
+        for department, courses in subject_config.DEPARTMENT_COURSES.items()
+        for course, subjects in courses.items()
+    ]
+
+
+def plan(students, faculty, seed):
+    """Decide which course each student takes and who teaches each subject"""
+    rng = _rng(seed, "plan")
+    catalog = build_catalog()
+
+    course_weights = []
+    for department, course, _ in catalog:
+        courses_in_dept = len(subject_config.DEPARTMENT_COURSES[department])
+        course_weights.append(DEPARTMENT_WEIGHTS.get(department, 0.1) / courses_in_dept)
+    student_course = rng.choices(range(len(catalog)), weights=course_weights, k=students)
+
+    # Every subject needs a teacher; extra faculty go where the students are
+    slots = [(c, subject) for c, (_, _, subjects) in enumerate(catalog) for subject in subjects]
+    if faculty < len(slots):
+        raise ValueError(f"Need at least {len(slots)} faculty to cover every subject")
+    slot_weights = [course_weights[c] for c, _ in slots]
+    faculty_slots = slots + rng.choices(slots, weights=slot_weights, k=faculty - len(slots))
+    rng.shuffle(faculty_slots)
+
+    teachers = {}  # (course index, subject) -> [faculty offsets]
+    for offset, slot in enumerate(faculty_slots):
+        teachers.setdefault(slot, []).append(offset)
+
+    return catalog, student_course, faculty_slots, teachers
+
+
+def generate_dataset(students=2000, faculty=120, days=120, seed=42,
+                     end_date=None, student_id_start=1, faculty_id_start=1):
+    """Yield (table, columns, rows) with rows produced lazily"""
+    catalog, student_course, faculty_slots, teachers = plan(students, faculty, seed)
+    end_date = end_date or datetime.date.today()
+    first_day = end_date - datetime.timedelta(days=days - 1)
+    school_days = [first_day + datetime.timedelta(days=d) for d in range(days)
+                   if (first_day + datetime.timedelta(days=d)).weekday() < 5]
+
+    def student_name(offset):
+        rng = _rng(seed, f"name:{offset}")
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    def faculty_name(offset):
+        rng = _rng(seed, f"faculty-name:{offset}")
+        return f"Dr. {rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    def student_rows():
+        rng = _rng(seed, "student_details")
+        for offset in range(students):
+            sid = student_id_start + offset
+            yield (sid, student_name(offset), rng.randint(17, 26),
+                   rng.choice(["Male", "Female", "Male", "Female", "Other"]), f"9{sid:09d}")
+
+    def faculty_rows():
+        rng = _rng(seed, "faculty_details")
+        for offset, (c, _) in enumerate(faculty_slots):
+            fid = faculty_id_start + offset
+            department = catalog[c][0]
+            yield (fid, faculty_name(offset), department, f"8{fid:09d}",
+                   rng.choice(QUALIFICATIONS), f"faculty{fid}@university.edu")
+
+    def teaching_rows():
+        rng = _rng(seed, "faculty_teaching")
+        for offset, (c, subject) in enumerate(faculty_slots):
+            semester = rng.randint(1, 8)
+            yield (faculty_id_start + offset, catalog[c][1], subject,
+                   f"{_ordinal((semester + 1) // 2)} Year", f"{_ordinal(semester)} Semester",
+                   rng.choice(DESIGNATIONS))
+
+    def login_rows():
+        yield ("admin", "admin123", "admin", "admin@university.edu", "", None)
+        for offset in range(faculty):
+            fid = faculty_id_start + offset
+            yield (f"faculty_{fid}", "faculty123", "faculty", f"faculty{fid}@university.edu", f"8{fid:09d}", fid)
+        for offset in range(students):
+            sid = student_id_start + offset
+            first = student_name(offset).split()[0].lower()
+            yield (f"{first}_{sid}", "student123", "student", f"{first}.{sid}@student.university.edu",
+                   f"9{sid:09d}", sid)
+
+    def result_rows():
+        rng = _rng(seed, "results")
+        for offset in range(students):
+            c = student_course[offset]
+            course = catalog[c][1]
+            for subject in catalog[c][2]:
+                fid = faculty_id_start + rng.choice(teachers[(c, subject)])
+                grade = _weighted(rng, GRADE_WEIGHTS) if rng.random() < 0.8 else None
+                yield (student_id_start + offset, fid, course, grade)
+
+    def attendance_rows():
+        rng = _rng(seed, "attendance")
+        for offset in range(students):
+            sid = student_id_start + offset
+            name = student_name(offset)
+            present_rate = rng.betavariate(8, 2)
+            for day in school_days:
+                yield (sid, name, day, "Present" if rng.random() < present_rate else "Absent")
+
+    def fee_rows():
+        rng = _rng(seed, "fees")
+        semester_starts = sorted({datetime.date(d.year, 1 if d.month < 7 else 7, 15) for d in school_days})
+        for offset in range(students):
+            name = student_name(offset)
+            for due in semester_starts:
+                for fee_type, base, probability in FEE_SCHEDULE:
+                    if rng.random() > probability:
+                        continue
+                    amount = round(base * rng.uniform(0.9, 1.1), -2)
+                    if due > end_date:
+                        status = "Pending"
+                    else:
+                        status = _weighted(rng, {"Paid": 85, "Pending": 10, "Partial": 5})
+                    yield (name, amount, due, status, fee_type, f"{fee_type} fee for semester starting {due}")
+
+    yield "student_details", ["id", "name", "age", "sex", "phoneno"], student_rows()
+    yield "faculty_details", ["id", "name", "department", "phoneno", "qualification", "email"], faculty_rows()
+    yield "faculty_teaching", ["faculty_id", "course", "subject", "year", "semester", "designation"], teaching_rows()
+    yield "login_details", ["uname", "password", "typeOfUser", "email", "phoneno", "user_id"], login_rows()
+    yield "results", ["student_id", "faculty_id", "course", "grade"], result_rows()
+    yield "attendance", ["student_id", "student_name", "date", "status"], attendance_rows()
+    yield "fees", ["student_name", "amount", "due_date", "status", "fee_type", "description"], fee_rows()
+
+
+def insert_sql(table, columns, placeholder="%s"):
+    cols = ", ".join(columns)
+    marks = ", ".join([placeholder] * len(columns))
+    return f"INSERT INTO {table} ({cols}) VALUES ({marks})"
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def load(conn, dataset, commit_every=50000, batch_size=None):
+    """Write a dataset over ``conn``, committing every ``commit_every`` rows"""
+    totals = {}
+    for table, columns, rows in dataset:
+        started = time.monotonic()
+        sql = insert_sql(table, columns)
+        count = 0
+        for chunk in _chunks(rows, commit_every):
+            conn.start_transaction()
+            Transaction(conn).execute_many(sql, chunk, batch_size)
+            conn.commit()
+            count += len(chunk)
+        totals[table] = count
+        print(f"   ✅ {table}: {count:,} rows in {time.monotonic() - started:.1f}s")
+    return totals
+
+
+def reset(conn):
+    cursor = conn.cursor()
+    try:
+        for table in reversed(TABLES):
+            cursor.execute(f"TRUNCATE TABLE {table}")
+    finally:
+        cursor.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a deterministic SMS dataset")
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--faculty", type=int, default=120)
+    parser.add_argument("--days", type=int, default=120, help="attendance window ending today")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="truncate all tables first")
+    parser.add_argument("--commit-every", type=int, default=50000)
+    parser.add_argument("--batch-size", type=int, default=get_batch_size())
+    args = parser.parse_args(argv)
+
+    conn = get_connection()
+    if not conn:
+        return 1
+
+    try:
+        cursor = conn.cursor()
+        # Bulk load session: constraints are already satisfied by construction
+        cursor.execute("SET SESSION foreign_key_checks = 0")
+        cursor.execute("SET SESSION unique_checks = 0")
+        cursor.close()
+
+        if args.reset:
+            print("🧹 Truncating tables...")
+            reset(conn)
+            student_start = faculty_start = 1
+        else:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM student_details")
+            student_start = cursor.fetchone()[0] + 1
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM faculty_details")
+            faculty_start = cursor.fetchone()[0] + 1
+            cursor.close()
+
+        print(f"🏗️  Generating {args.students:,} students, {args.faculty:,} faculty, "
+              f"{args.days} days of attendance (seed {args.seed})")
+        dataset = generate_dataset(args.students, args.faculty, args.days, args.seed,
+                                   student_id_start=student_start, faculty_id_start=faculty_start)
+        if not args.reset:
+            # The admin login already exists when appending
+            dataset = ((t, c, (r for r in rows if r[0] != "admin") if t == "login_details" else rows)
+                       for t, c, rows in dataset)
+        load(conn, dataset, args.commit_every, args.batch_size)
+
+        # Bulk rows bypass the app's write paths, so recompute the summaries
+        conn.start_transaction()
+        rollups.rebuild(Transaction(conn))
+        gpa.rebuild(Transaction(conn))
+        conn.commit()
+        print("   ✅ rollups and GPA tables rebuilt")
+        print("✅ Done")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# gpa.py - Grade scale and materialized GPA tables
+"""
+``GRADE_POINTS`` is the one grade scale used across the app. SQL averages
+are generated from it with ``points_sql()`` so views never carry their own
+copy.
+
+``student_gpa`` and ``faculty_gpa`` hold the averages (and, for faculty,
+student and course counts) so reports and rankings are indexed reads
+instead of aggregates over all of ``results``. Every write path that
+changes ``results`` calls ``refresh()`` for the affected students and
+faculty inside the same transaction:
+
+    with transaction() as tx:
+        tx.execute_many("UPDATE results SET grade=%s WHERE ...", rows)
+        gpa.refresh(tx, student_ids, [faculty_id])
+
+    python gpa.py rebuild    # recompute both tables from results
+"""
+import sys
+
+from config import transaction
+
+GRADE_POINTS = {
+    "A+": 4.0, "A": 4.0, "A-": 3.7,
+    "B+": 3.3, "B": 3.0, "B-": 2.7,
+    "C+": 2.3, "C": 2.0, "C-": 1.7,
+    "D+": 1.3, "D": 1.0, "F": 0.0,
+}
+GRADES = list(GRADE_POINTS)
+
+
+def points_sql(column="grade"):
+    """CASE expression mapping ``column`` to grade points (NULL if ungraded)"""
+    by_points = {}
+    for grade, points in GRADE_POINTS.items():
+        by_points.setdefault(points, []).append(grade)
+    branches = " ".join(
+        f"WHEN {column} IN ({', '.join(repr(g) for g in grades)}) THEN {points}"
+        for points, grades in by_points.items()
+    )
+    return f"CASE {branches} ELSE NULL END"
+
+
+# -------------------------------------------------------------
+# Materialized tables
+# -------------------------------------------------------------
+def _student_select(where=""):
+    points = points_sql("grade")
+    return f"""
+        SELECT student_id, COUNT({points}), COALESCE(SUM({points}), 0), AVG({points})
+        FROM results
+        WHERE student_id IS NOT NULL {where}
+        GROUP BY student_id
+    """
+
+
+def _faculty_select(where=""):
+    points = points_sql("grade")
+    return f"""
+        SELECT faculty_id, COUNT(DISTINCT student_id), COUNT(DISTINCT course), COUNT({points}), AVG({points})
+        FROM results
+        WHERE faculty_id IS NOT NULL {where}
+        GROUP BY faculty_id
+    """
+
+
+def affected(tx, where, params):
+    """Student and faculty ids of the results rows matching ``where``"""
+    rows = tx.fetch(f"SELECT DISTINCT student_id, faculty_id FROM results WHERE {where}", params)
+    return {r[0] for r in rows if r[0] is not None}, {r[1] for r in rows if r[1] is not None}
+
+
+def refresh(tx, student_ids=(), faculty_ids=()):
+    """Recompute the GPA rows of the given students and faculty"""
+    student_ids = sorted(set(student_ids))
+    faculty_ids = sorted(set(faculty_ids))
+
+    if student_ids:
+        marks = ", ".join(["%s"] * len(student_ids))
+        tx.execute(f"DELETE FROM student_gpa WHERE student_id IN ({marks})", student_ids)
+        tx.execute(
+            "INSERT INTO student_gpa (student_id, graded_courses, total_points, gpa) "
+            + _student_select(f"AND student_id IN ({marks})"),
+            student_ids,
+        )
+
+    if faculty_ids:
+        marks = ", ".join(["%s"] * len(faculty_ids))
+        tx.execute(f"DELETE FROM faculty_gpa WHERE faculty_id IN ({marks})", faculty_ids)
+        tx.execute(
+            "INSERT INTO faculty_gpa (faculty_id, students, courses, graded, gpa) "
+            + _faculty_select(f"AND faculty_id IN ({marks})"),
+            faculty_ids,
+        )
+
+
+def rebuild(tx):
+    """Recompute both GPA tables from ``results`` inside ``tx``"""
+    tx.execute("DELETE FROM student_gpa")
+    students = tx.execute("INSERT INTO student_gpa (student_id, graded_courses, total_points, gpa) "
+                          + _student_select())
+    tx.execute("DELETE FROM faculty_gpa")
+    faculty = tx.execute("INSERT INTO faculty_gpa (faculty_id, students, courses, graded, gpa) "
+                         + _faculty_select())
+    return students, faculty
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["rebuild"]:
+        print("Usage: python gpa.py rebuild")
+        sys.exit(2)
+    try:
+        with transaction() as tx:
+            students, faculty = rebuild(tx)
+        print(f"✅ Rebuilt student_gpa ({students} rows) and faculty_gpa ({faculty} rows)")
+    except Exception as e:
+        print(f"❌ Rebuild failed: {e}")
+        sys.exit(1)
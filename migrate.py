@@ -0,0 +1,221 @@
+# migrate.py - Versioned schema migrations
+"""
+Apply the ordered SQL files in ``migrations/`` and record them in the
+``schema_migrations`` table.
+
+    python migrate.py            # apply pending migrations
+    python migrate.py status     # show applied / pending versions
+    python migrate.py --dry-run  # list the statements that would run (read-only)
+
+Migration files are named ``NNN_description.sql`` and run in version order.
+Each file is applied once. Statements that fail because their change is
+already present (duplicate column, index or table) count as applied, so a
+database patched by hand can be brought under version control safely.
+Keep one schema change per ALTER statement so this check stays precise.
+
+Index and column changes on large tables should use
+``ALGORITHM=INPLACE, LOCK=NONE``. The runner also keeps DDL from queueing
+behind long-running transactions: it sets a short ``lock_wait_timeout`` and
+retries a statement that times out waiting for its metadata lock, so a
+migration never stalls the live application.
+"""
+import hashlib
+import os
+import re
+import sys
+import time
+
+import mysql.connector
+from config import get_connection
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# Errors meaning "this change is already in place"
+ALREADY_APPLIED_ERRORS = {
+    1050,  # Table already exists
+    1060,  # Duplicate column name
+    1061,  # Duplicate key name
+    1091,  # Can't DROP; check that column/key exists
+    1826,  # Duplicate foreign key constraint name
+}
+LOCK_WAIT_TIMEOUT_ERROR = 1205
+
+LOCK_WAIT_SECONDS = int(os.getenv("DB_MIGRATION_LOCK_WAIT", "5"))
+LOCK_RETRIES = int(os.getenv("DB_MIGRATION_RETRIES", "10"))
+
+FILENAME_RE = re.compile(r"^(\d+)_([\w\-]+)\.sql$")
+
+
+def discover_migrations(directory=MIGRATIONS_DIR):
+    """Return (version, name, path) for every migration file, in order"""
+    migrations = []
+    for filename in os.listdir(directory):
+        match = FILENAME_RE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    migrations.sort()
+
+    versions = [m[0] for m in migrations]
+    duplicates = {v for v in versions if versions.count(v) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate migration versions: {sorted(duplicates)}")
+    return migrations
+
+
+def split_statements(sql):
+    """Split a migration file into statements, dropping ``--`` comment lines"""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    statements = []
+    current = []
+    for line in lines:
+        current.append(line)
+        if line.rstrip().endswith(";"):
+            statement = "\n".join(current).strip().rstrip(";").strip()
+            if statement:
+                statements.append(statement)
+            current = []
+    leftover = "\n".join(current).strip()
+    if leftover:
+        statements.append(leftover)
+    return statements
+
+
+def checksum(sql):
+    return hashlib.sha256(sql.encode("utf-8")).hexdigest()
+
+
+def ensure_version_table(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INT NOT NULL PRIMARY KEY,
+            name VARCHAR(200) NOT NULL,
+            checksum CHAR(64) NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            duration_ms INT NOT NULL DEFAULT 0
+        )
+    """)
+
+
+def version_table_exists(cursor):
+    cursor.execute("SHOW TABLES LIKE 'schema_migrations'")
+    return bool(cursor.fetchall())
+
+
+def applied_versions(cursor):
+    cursor.execute("SELECT version, checksum FROM schema_migrations")
+    return {version: digest for version, digest in cursor.fetchall()}
+
+
+def run_statement(cursor, statement):
+    """Run one statement, retrying when it cannot get its metadata lock"""
+    for attempt in range(1, LOCK_RETRIES + 1):
+        try:
+            cursor.execute(statement)
+            if cursor.with_rows:
+                cursor.fetchall()
+            return "applied"
+        except mysql.connector.Error as e:
+            if e.errno in ALREADY_APPLIED_ERRORS:
+                return "already present"
+            if e.errno == LOCK_WAIT_TIMEOUT_ERROR and attempt < LOCK_RETRIES:
+                wait = min(2 ** attempt, 30)
+                print(f"   ⏳ Lock wait timeout, retrying in {wait}s ({attempt}/{LOCK_RETRIES})")
+                time.sleep(wait)
+                continue
+            raise
+
+
+def apply_migration(conn, version, name, path, dry_run=False):
+    with open(path, encoding="utf-8") as f:
+        sql = f.read()
+    statements = split_statements(sql)
+
+    print(f"➡️  {version:03d}_{name} ({len(statements)} statements)")
+    if dry_run:
+        for statement in statements:
+            print(f"   {statement.splitlines()[0]} ...")
+        return
+
+    started = time.monotonic()
+    cursor = conn.cursor()
+    try:
+        for statement in statements:
+            outcome = run_statement(cursor, statement)
+            print(f"   ✅ {outcome}: {statement.splitlines()[0][:70]}")
+
+        duration_ms = int((time.monotonic() - started) * 1000)
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, name, checksum, duration_ms) VALUES (%s, %s, %s, %s)",
+            (version, name, checksum(sql), duration_ms),
+        )
+    finally:
+        cursor.close()
+
+
+def migrate(dry_run=False):
+    """Apply every pending migration; returns the number applied"""
+    conn = get_connection()
+    if not conn:
+        return None
+
+    # DDL commits implicitly in MySQL; run everything in autocommit mode
+    conn.autocommit = True
+    try:
+        cursor = conn.cursor()
+        if dry_run:
+            # A dry run must not write anything, not even the version table
+            done = applied_versions(cursor) if version_table_exists(cursor) else {}
+        else:
+            ensure_version_table(cursor)
+            cursor.execute("SET SESSION lock_wait_timeout = %s", (LOCK_WAIT_SECONDS,))
+            done = applied_versions(cursor)
+        cursor.close()
+
+        pending = [m for m in discover_migrations() if m[0] not in done]
+        if not pending:
+            print("✅ Schema is up to date")
+            return 0
+
+        for version, name, path in pending:
+            apply_migration(conn, version, name, path, dry_run=dry_run)
+        if not dry_run:
+            print(f"✅ Applied {len(pending)} migration(s)")
+        return len(pending)
+    finally:
+        conn.close()
+
+
+def status():
+    """Print applied and pending migrations, flagging edited files"""
+    conn = get_connection()
+    if not conn:
+        return
+    try:
+        cursor = conn.cursor()
+        # Read-only: a database that was never migrated has no version table yet
+        done = applied_versions(cursor) if version_table_exists(cursor) else {}
+        cursor.close()
+    finally:
+        conn.close()
+
+    if not done:
+        print("ℹ️ No migrations applied yet")
+
+    for version, name, path in discover_migrations():
+        if version not in done:
+            print(f"⏳ {version:03d}_{name}  pending")
+            continue
+        with open(path, encoding="utf-8") as f:
+            edited = checksum(f.read()) != done[version]
+        note = "  (file changed since it was applied)" if edited else ""
+        print(f"✅ {version:03d}_{name}  applied{note}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if "status" in args:
+        status()
+    else:
+        result = migrate(dry_run="--dry-run" in args)
+        if result is None:
+            sys.exit(1)
@@ -0,0 +1,42 @@
+-- 001: key attendance rows by student_id instead of student_name
+--
+-- Every attendance reader filters by student and/or date, but the table only
+-- had a primary key on `id`, so each lookup was a full scan. This adds
+-- `student_id`, backfills it from `student_details`, removes duplicate
+-- (student, date) rows and adds the indexes the dashboards query through.
+
+ALTER TABLE attendance ADD COLUMN student_id INT NULL AFTER id, ALGORITHM=INPLACE, LOCK=NONE;
+
+-- Backfill from names; duplicate names resolve to the oldest student record
+UPDATE attendance a
+JOIN (
+    SELECT name, MIN(id) AS id
+    FROM student_details
+    GROUP BY name
+) s ON s.name = a.student_name
+SET a.student_id = s.id
+WHERE a.student_id IS NULL;
+
+-- Index the pairs first so the dedupe below reads an index instead of
+-- scanning and locking the whole table; replaced by the unique key below
+ALTER TABLE attendance ADD KEY idx_attendance_dedupe (student_id, date), ALGORITHM=INPLACE, LOCK=NONE;
+
+-- Keep only the most recent mark per student and date before adding the unique key.
+-- The derived table is one covering scan of idx_attendance_dedupe; only the
+-- duplicate rows themselves are looked up, locked and deleted.
+DELETE older
+FROM attendance older
+JOIN (
+    SELECT student_id, date, MAX(id) AS keep_id
+    FROM attendance
+    WHERE student_id IS NOT NULL
+    GROUP BY student_id, date
+    HAVING COUNT(*) > 1
+) dup ON dup.student_id = older.student_id AND dup.date = older.date
+WHERE older.id < dup.keep_id;
+
+ALTER TABLE attendance ADD UNIQUE KEY uq_attendance_student_date (student_id, date), ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE attendance DROP KEY idx_attendance_dedupe, ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE attendance ADD KEY idx_attendance_date (date), ALGORITHM=INPLACE, LOCK=NONE;
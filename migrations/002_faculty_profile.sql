@@ -0,0 +1,28 @@
+-- 002: faculty columns and tables the application already depends on
+--
+-- add_faculty and the broken-link tools read and write
+-- faculty_details.qualification, faculty_details.email and faculty_teaching,
+-- none of which are in the original sms_schema.sql dump. Databases that
+-- were patched by hand already have them; those statements are skipped.
+
+ALTER TABLE faculty_details ADD COLUMN qualification VARCHAR(100) NULL, ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE faculty_details ADD COLUMN email VARCHAR(100) NULL, ALGORITHM=INPLACE, LOCK=NONE;
+
+CREATE TABLE IF NOT EXISTS faculty_teaching (
+  `id` int NOT NULL AUTO_INCREMENT,
+  `faculty_id` int NOT NULL,
+  `course` varchar(100) DEFAULT NULL,
+  `subject` varchar(150) DEFAULT NULL,
+  `year` varchar(20) DEFAULT NULL,
+  `semester` varchar(20) DEFAULT NULL,
+  `designation` varchar(50) DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  KEY `idx_faculty_teaching_faculty` (`faculty_id`),
+  CONSTRAINT `faculty_teaching_ibfk_1` FOREIGN KEY (`faculty_id`) REFERENCES `faculty_details` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+-- Lookups used by add_faculty and the link fixers
+ALTER TABLE faculty_details ADD KEY idx_faculty_phone (phoneno), ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE faculty_details ADD KEY idx_faculty_email (email), ALGORITHM=INPLACE, LOCK=NONE;
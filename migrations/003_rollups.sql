@@ -0,0 +1,38 @@
+-- 003: summary tables for attendance and fee totals
+--
+-- The dashboards read these instead of scanning attendance and fees.
+-- rollups.py keeps them current from the application's write paths;
+-- `python rollups.py rebuild` recomputes them from the raw tables.
+
+CREATE TABLE IF NOT EXISTS attendance_monthly (
+  `student_id` int NOT NULL,
+  `month` date NOT NULL,
+  `present` int NOT NULL DEFAULT 0,
+  `absent` int NOT NULL DEFAULT 0,
+  PRIMARY KEY (`student_id`, `month`),
+  KEY `idx_attendance_monthly_month` (`month`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+CREATE TABLE IF NOT EXISTS fee_totals (
+  `status` varchar(20) NOT NULL,
+  `fee_type` varchar(50) NOT NULL,
+  `records` int NOT NULL DEFAULT 0,
+  `total` decimal(14,2) NOT NULL DEFAULT 0,
+  PRIMARY KEY (`status`, `fee_type`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+-- Backfill from existing rows
+INSERT INTO attendance_monthly (student_id, month, present, absent)
+SELECT student_id, DATE_FORMAT(date, '%Y-%m-01'),
+       SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END),
+       SUM(CASE WHEN status = 'Present' THEN 0 ELSE 1 END)
+FROM attendance
+WHERE student_id IS NOT NULL AND date IS NOT NULL
+GROUP BY student_id, DATE_FORMAT(date, '%Y-%m-01')
+ON DUPLICATE KEY UPDATE present = VALUES(present), absent = VALUES(absent);
+
+INSERT INTO fee_totals (status, fee_type, records, total)
+SELECT COALESCE(status, ''), COALESCE(fee_type, ''), COUNT(*), COALESCE(SUM(amount), 0)
+FROM fees
+GROUP BY COALESCE(status, ''), COALESCE(fee_type, '')
+ON DUPLICATE KEY UPDATE records = VALUES(records), total = VALUES(total);
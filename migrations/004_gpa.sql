@@ -0,0 +1,58 @@
+-- 004: materialized GPA per student and per faculty
+--
+-- Reports and rankings read these instead of averaging all of results.
+-- gpa.py keeps them current when grades or course assignments change;
+-- `python gpa.py rebuild` recomputes them. The backfill below uses the
+-- grade scale in gpa.GRADE_POINTS as of this migration.
+
+CREATE TABLE IF NOT EXISTS student_gpa (
+  `student_id` int NOT NULL,
+  `graded_courses` int NOT NULL DEFAULT 0,
+  `total_points` decimal(8,2) NOT NULL DEFAULT 0,
+  `gpa` decimal(4,3) DEFAULT NULL,
+  PRIMARY KEY (`student_id`),
+  KEY `idx_student_gpa_gpa` (`gpa`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+CREATE TABLE IF NOT EXISTS faculty_gpa (
+  `faculty_id` int NOT NULL,
+  `students` int NOT NULL DEFAULT 0,
+  `courses` int NOT NULL DEFAULT 0,
+  `graded` int NOT NULL DEFAULT 0,
+  `gpa` decimal(4,3) DEFAULT NULL,
+  PRIMARY KEY (`faculty_id`),
+  KEY `idx_faculty_gpa_gpa` (`gpa`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+-- Backfill from existing results
+INSERT INTO student_gpa (student_id, graded_courses, total_points, gpa)
+SELECT student_id, COUNT(points), COALESCE(SUM(points), 0), AVG(points)
+FROM (
+  SELECT student_id,
+         CASE WHEN grade IN ('A+', 'A') THEN 4.0 WHEN grade = 'A-' THEN 3.7
+              WHEN grade = 'B+' THEN 3.3 WHEN grade = 'B' THEN 3.0 WHEN grade = 'B-' THEN 2.7
+              WHEN grade = 'C+' THEN 2.3 WHEN grade = 'C' THEN 2.0 WHEN grade = 'C-' THEN 1.7
+              WHEN grade = 'D+' THEN 1.3 WHEN grade = 'D' THEN 1.0 WHEN grade = 'F' THEN 0.0
+              ELSE NULL END AS points
+  FROM results
+  WHERE student_id IS NOT NULL
+) graded
+GROUP BY student_id
+ON DUPLICATE KEY UPDATE graded_courses = VALUES(graded_courses),
+                        total_points = VALUES(total_points), gpa = VALUES(gpa);
+
+INSERT INTO faculty_gpa (faculty_id, students, courses, graded, gpa)
+SELECT faculty_id, COUNT(DISTINCT student_id), COUNT(DISTINCT course), COUNT(points), AVG(points)
+FROM (
+  SELECT faculty_id, student_id, course,
+         CASE WHEN grade IN ('A+', 'A') THEN 4.0 WHEN grade = 'A-' THEN 3.7
+              WHEN grade = 'B+' THEN 3.3 WHEN grade = 'B' THEN 3.0 WHEN grade = 'B-' THEN 2.7
+              WHEN grade = 'C+' THEN 2.3 WHEN grade = 'C' THEN 2.0 WHEN grade = 'C-' THEN 1.7
+              WHEN grade = 'D+' THEN 1.3 WHEN grade = 'D' THEN 1.0 WHEN grade = 'F' THEN 0.0
+              ELSE NULL END AS points
+  FROM results
+  WHERE faculty_id IS NOT NULL
+) graded
+GROUP BY faculty_id
+ON DUPLICATE KEY UPDATE students = VALUES(students), courses = VALUES(courses),
+                        graded = VALUES(graded), gpa = VALUES(gpa);
@@ -0,0 +1,12 @@
+-- 005: indexes for paginated student search
+--
+-- Manage Students pages by (name, id) with a keyset condition and
+-- searches by name prefix, phone prefix, or any word of the name.
+
+ALTER TABLE student_details ADD KEY idx_student_name (name, id), ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE student_details ADD KEY idx_student_phone (phoneno), ALGORITHM=INPLACE, LOCK=NONE;
+
+-- The first FULLTEXT index on a table cannot be built with LOCK=NONE;
+-- reads continue while it builds, writes to student_details wait.
+ALTER TABLE student_details ADD FULLTEXT KEY ft_student_name (name), ALGORITHM=INPLACE, LOCK=SHARED;
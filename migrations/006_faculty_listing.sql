@@ -0,0 +1,8 @@
+-- 006: indexes for the paginated Manage Faculty list
+--
+-- The list pages by (name, id) and looks up each faculty member's login
+-- with a covering index on login_details.
+
+ALTER TABLE faculty_details ADD KEY idx_faculty_name (name, id), ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE login_details ADD KEY idx_login_user (user_id, typeOfUser, uname), ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,5 @@
+-- 007: index for the paginated View All Fees list
+--
+-- The list pages by (due_date, id), newest first.
+
+ALTER TABLE fees ADD KEY idx_fees_due_date (due_date, id), ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,8 @@
+-- 008: index for the System Analytics attendance breakdown
+--
+-- The chart counts attendance rows per status. The rollup only keeps
+-- present/absent per student, so it cannot tell Late or Excused apart or
+-- count rows without a student_id; the chart reads the raw table through
+-- this covering index instead.
+
+ALTER TABLE attendance ADD KEY idx_attendance_status (status), ALGORITHM=INPLACE, LOCK=NONE;
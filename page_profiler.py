@@ -0,0 +1,178 @@
+# page_profiler.py - Opt-in per-rerun profiling of dashboard pages
+"""
+Splits the wall time of each Streamlit rerun into database, Python and
+render phases and counts the queries, elements and widgets it produced.
+
+Profiling is off unless ``SMS_PROFILE=1`` is set or the app is opened with
+``?profile=1``. When on, every rerun is appended to
+``logs/page_trace.jsonl`` and the latest runs are shown in a sidebar panel.
+
+    with profile_page("admin"):
+        admin_dashboard()          # calls label_page("Manage Students")
+"""
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+import query_stats
+
+TRACE_FILE = os.path.join(query_stats.LOG_DIR, "page_trace.jsonl")
+PANEL_HISTORY = 20
+
+# Element types that are interactive widgets rather than static output
+WIDGET_TYPES = {
+    "button", "checkbox", "color_picker", "data_editor", "arrow_data_frame_editor",
+    "date_input", "download_button", "file_uploader", "multiselect", "number_input",
+    "radio", "selectbox", "slider", "text_area", "text_input", "time_input",
+    "toggle", "camera_input", "chat_input", "form_submit_button",
+}
+
+_current = contextvars.ContextVar("page_trace", default=None)
+_trace_lock = threading.Lock()
+_hooks_installed = False
+
+
+class PageTrace:
+    """Counters for one rerun of one page"""
+
+    def __init__(self, page):
+        self.page = page
+        self.db_ms = 0.0
+        self.queries = 0
+        self.render_ms = 0.0
+        self.elements = 0
+        self.widgets = 0
+        self._lock = threading.Lock()
+
+    def add_query(self, elapsed_ms, acquire_ms):
+        with self._lock:
+            self.db_ms += elapsed_ms + acquire_ms
+            self.queries += 1
+
+    def add_element(self, delta_type, elapsed_ms):
+        with self._lock:
+            self.render_ms += elapsed_ms
+            self.elements += 1
+            if delta_type in WIDGET_TYPES:
+                self.widgets += 1
+
+
+def is_enabled():
+    """Profiling is opt-in via SMS_PROFILE=1 or the ?profile=1 query param"""
+    if os.getenv("SMS_PROFILE", "0") == "1":
+        return True
+    try:
+        return st.query_params.get("profile") == "1"
+    except Exception:
+        return False
+
+
+def _on_query(query, elapsed_ms, rows, acquire_ms, error):
+    trace = _current.get()
+    if trace is not None:
+        trace.add_query(elapsed_ms, acquire_ms)
+
+
+def _install_hooks():
+    """Count queries and time element emission while a trace is active"""
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    _hooks_installed = True
+
+    query_stats.add_listener(_on_query)
+
+    from streamlit.delta_generator import DeltaGenerator
+    original_enqueue = DeltaGenerator._enqueue
+
+    def timed_enqueue(self, *args, **kwargs):
+        trace = _current.get()
+        if trace is None:
+            return original_enqueue(self, *args, **kwargs)
+        delta_type = args[0] if args else kwargs.get("delta_type")
+        started = time.perf_counter()
+        try:
+            return original_enqueue(self, *args, **kwargs)
+        finally:
+            trace.add_element(delta_type, (time.perf_counter() - started) * 1000)
+
+    DeltaGenerator._enqueue = timed_enqueue
+
+
+def label_page(name):
+    """Name the page being rendered in the active trace, if any"""
+    trace = _current.get()
+    if trace is not None:
+        trace.page = f"{trace.page}/{name}"
+
+
+@contextmanager
+def profile_page(page):
+    """Profile everything rendered inside the ``with`` block"""
+    if not is_enabled():
+        yield None
+        return
+
+    _install_hooks()
+    trace = PageTrace(page)
+    token = _current.set(trace)
+    started = time.perf_counter()
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+        wall_ms = (time.perf_counter() - started) * 1000
+        _finish(trace, wall_ms)
+
+
+def _finish(trace, wall_ms):
+    record = {
+        "ts": time.time(),
+        "page": trace.page,
+        "user": st.session_state.get("username", ""),
+        "wall_ms": round(wall_ms, 2),
+        "db_ms": round(trace.db_ms, 2),
+        "render_ms": round(trace.render_ms, 2),
+        "python_ms": round(max(wall_ms - trace.db_ms - trace.render_ms, 0.0), 2),
+        "queries": trace.queries,
+        "elements": trace.elements,
+        "widgets": trace.widgets,
+    }
+
+    history = st.session_state.setdefault("_page_traces", [])
+    history.append(record)
+    del history[:-PANEL_HISTORY]
+
+    try:
+        os.makedirs(os.path.dirname(TRACE_FILE), exist_ok=True)
+        with _trace_lock, open(TRACE_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        print(f"❌ Could not write page trace: {e}")
+
+
+def render_debug_panel():
+    """Show the latest profiled reruns in the sidebar"""
+    if not is_enabled():
+        return
+    history = st.session_state.get("_page_traces", [])
+    with st.sidebar.expander("⏱️ Page Profiler", expanded=False):
+        if not history:
+            st.caption("No profiled reruns yet.")
+            return
+        last = history[-1]
+        st.caption(f"Last: {last['page']}")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Wall", f"{last['wall_ms']:.0f} ms")
+            st.metric("DB", f"{last['db_ms']:.0f} ms", f"{last['queries']} queries", delta_color="off")
+        with col2:
+            st.metric("Render", f"{last['render_ms']:.0f} ms", f"{last['widgets']} widgets", delta_color="off")
+            st.metric("Python", f"{last['python_ms']:.0f} ms")
+        st.dataframe(list(reversed(history)), use_container_width=True)
+        st.caption(f"Trace file: {TRACE_FILE}")
@@ -0,0 +1,127 @@
+# pagination.py - Keyset pagination and indexed search for long lists
+"""
+Pages are fetched with a keyset ("seek") condition on the sort column and
+id instead of OFFSET, so every page costs the same no matter how deep the
+user goes:
+
+    pager = Pager("students", filters=search_term)
+    rows, next_cursor = fetch_page(
+        "SELECT id, name, age, sex, phoneno FROM student_details",
+        sort_col="name", id_col="id", cursor=pager.cursor,
+        cursor_of=lambda row: (row[1], row[0]),
+    )
+    ...render rows...
+    pager.render(next_cursor)
+
+``Pager`` keeps the cursor of every visited page in session state so
+"Previous" is a pop, not a query.
+"""
+import os
+import re
+
+import streamlit as st
+
+from config import fetch_details
+
+PAGE_SIZE = int(os.getenv("SMS_PAGE_SIZE", "50"))
+FULLTEXT_MIN_LENGTH = 3  # InnoDB's default innodb_ft_min_token_size
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def escape_like(term):
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def text_search(term, name_col, phone_col=None, fulltext=True):
+    """Return ``(sql, params)`` matching ``term`` against indexed columns.
+
+    Digits search the phone number by prefix. Otherwise names are matched
+    with the FULLTEXT index (any word starting with each search word) when
+    every word is long enough to be indexed, and by prefix on the name
+    index when it is not. Returns None for an empty term.
+    """
+    term = (term or "").strip()
+    if not term:
+        return None
+    if phone_col and term.replace("+", "").replace(" ", "").isdigit():
+        return f"{phone_col} LIKE %s", (escape_like(term.replace(" ", "")) + "%",)
+
+    words = _WORD_RE.findall(term)
+    if fulltext and words and all(len(w) >= FULLTEXT_MIN_LENGTH for w in words):
+        return f"MATCH({name_col}) AGAINST (%s IN BOOLEAN MODE)", (" ".join(f"+{w}*" for w in words),)
+    return f"{name_col} LIKE %s", (escape_like(term) + "%",)
+
+
+def fetch_page(query, sort_col, id_col, cursor_of, cursor=None, filters=(), page_size=None, descending=False):
+    """Fetch one page of ``query`` ordered by (sort_col, id_col).
+
+    ``filters`` is a list of ``(sql, params)`` conditions ANDed together.
+    NULLs in ``sort_col`` follow MySQL's order (first ascending, last
+    descending). Returns ``(rows, next_cursor)``; ``next_cursor`` is None on
+    the last page. Returns ``(None, None)`` if the query failed.
+    """
+    page_size = page_size or PAGE_SIZE
+    op, direction = ("<", " DESC") if descending else (">", "")
+    conditions = [sql for sql, _ in filters if sql]
+    params = [p for sql, ps in filters if sql for p in ps]
+    if cursor is not None:
+        value, last_id = cursor
+        if value is None:
+            seek = f"({sort_col} IS NULL AND {id_col} {op} %s)"
+            if not descending:
+                seek = f"({seek} OR {sort_col} IS NOT NULL)"
+            params += [last_id]
+        else:
+            seek = f"{sort_col} {op} %s OR ({sort_col} = %s AND {id_col} {op} %s)"
+            if descending:
+                seek += f" OR {sort_col} IS NULL"
+            seek = f"({seek})"
+            params += [value, value, last_id]
+        conditions.append(seek)
+
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    rows = fetch_details(
+        f"{query}{where} ORDER BY {sort_col}{direction}, {id_col}{direction} LIMIT %s",
+        tuple(params) + (page_size + 1,),
+    )
+    if rows is None:
+        return None, None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, cursor_of(rows[-1])
+    return rows, None
+
+
+class Pager:
+    """Cursor stack for one paginated list, reset when its filters change"""
+
+    def __init__(self, key, filters=None):
+        self.key = key
+        state_key = f"_pager_{key}"
+        state = st.session_state.get(state_key)
+        if state is None or state["filters"] != filters:
+            state = st.session_state[state_key] = {"filters": filters, "cursors": [None]}
+        self._cursors = state["cursors"]
+
+    @property
+    def cursor(self):
+        return self._cursors[-1]
+
+    @property
+    def page(self):
+        return len(self._cursors)
+
+    def render(self, next_cursor):
+        """Show Previous/Next controls under the list"""
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("⬅️ Previous", key=f"{self.key}_prev", disabled=self.page == 1):
+                self._cursors.pop()
+                st.rerun()
+        with col2:
+            st.caption(f"Page {self.page}")
+        with col3:
+            if st.button("Next ➡️", key=f"{self.key}_next", disabled=next_cursor is None):
+                self._cursors.append(next_cursor)
+                st.rerun()
@@ -0,0 +1,127 @@
+# query_cache.py - Shared read-through cache for SELECT results
+"""
+Caches rows returned by ``config.fetch_cached`` for all sessions in this
+process, keyed by statement and parameters, with a TTL and LRU eviction.
+
+Each entry is tagged with the tables its statement reads. Writes made through
+``config`` (``execute_query``, ``execute_many`` and ``transaction()``) drop
+every entry tagged with a table they touched as soon as they commit, so
+totals are never stale after a change made in this process. Writes from
+other processes (migrations, ``generate_data.py``, a second app server) are
+only picked up when the TTL expires.
+
+    DB_CACHE=0          disable caching
+    DB_CACHE_TTL=30     seconds an entry stays valid
+    DB_CACHE_SIZE=512   maximum number of entries
+"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+ENABLED = os.getenv("DB_CACHE", "1") == "1"
+DEFAULT_TTL = float(os.getenv("DB_CACHE_TTL", "30"))
+MAX_ENTRIES = int(os.getenv("DB_CACHE_SIZE", "512"))
+
+_TABLE_RE = re.compile(r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE)\s+`?(\w+)`?", re.IGNORECASE)
+_UPSERT_RE = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b.*", re.IGNORECASE | re.DOTALL)
+
+
+def tables_in(query):
+    """Return the lower-cased table names a statement reads or writes"""
+    query = _UPSERT_RE.sub("", query)
+    return frozenset(name.lower() for name in _TABLE_RE.findall(query))
+
+
+class QueryCache:
+    """Thread-safe TTL + LRU cache with table-level invalidation"""
+
+    def __init__(self, max_entries=512, ttl=30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, tables, rows)
+        self._versions = {}  # table -> bumped on every write
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key):
+        """Return cached rows for ``key``, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[2]
+
+    def versions(self, tables):
+        """Write counters for ``tables``; pass to ``put`` to detect races"""
+        with self._lock:
+            return tuple(self._versions.get(t, 0) for t in sorted(tables))
+
+    def put(self, key, tables, rows, versions, ttl=None):
+        """Store rows unless one of ``tables`` was written since ``versions``"""
+        with self._lock:
+            if versions != tuple(self._versions.get(t, 0) for t in sorted(tables)):
+                return False
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), tables, rows)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return True
+
+    def invalidate(self, tables):
+        """Drop every entry that reads any of ``tables``"""
+        if not tables:
+            return 0
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+            stale = [key for key, entry in self._entries.items() if entry[1] & tables]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits / lookups) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+_cache = QueryCache(MAX_ENTRIES, DEFAULT_TTL)
+
+
+def get_cache():
+    return _cache
+
+
+def invalidate_tables(tables):
+    """Invalidate cached reads of ``tables`` (an iterable of names)"""
+    return _cache.invalidate(frozenset(t.lower() for t in tables))
+
+
+def stats():
+    return _cache.stats()
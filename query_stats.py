@@ -0,0 +1,246 @@
+# query_stats.py - Per-query timing, slow-query log and latency percentiles
+"""
+Every statement that goes through ``config`` is recorded here with its
+latency, row count and connection-acquire time, grouped by a normalized
+statement fingerprint (literals and placeholders replaced by ``?``).
+
+Statements slower than ``DB_SLOW_QUERY_MS`` are written to a rotating
+``slow_queries.log``. Aggregates are periodically written to
+``query_stats.json`` in ``SMS_LOG_DIR`` so they can be inspected from
+another process:
+
+    python query_stats.py               # top statements by p95
+    python query_stats.py --sort total  # by total time spent
+"""
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+
+LOG_DIR = os.getenv("SMS_LOG_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs"))
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+SAMPLES_PER_QUERY = int(os.getenv("DB_STATS_SAMPLES", "1000"))
+DUMP_INTERVAL = float(os.getenv("DB_STATS_DUMP_INTERVAL", "60"))
+STATS_FILE = os.path.join(LOG_DIR, "query_stats.json")
+
+_lock = threading.Lock()
+_stats = {}
+_last_dump = time.monotonic()
+_slow_logger = None
+_listeners = []
+
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%s|%\(\w+\)s")
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_RE = re.compile(r"\bVALUES\s*(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+", re.IGNORECASE)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint(query):
+    """Normalize a statement so calls differing only in values group together"""
+    text = _STRING_RE.sub("?", query)
+    text = _PLACEHOLDER_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _SPACE_RE.sub(" ", text).strip()
+    text = _IN_LIST_RE.sub("IN (...)", text)
+    text = _VALUES_RE.sub(r"VALUES \1, ...", text)
+    return text
+
+
+def fingerprint_id(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def _get_slow_logger():
+    global _slow_logger
+    if _slow_logger is None:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        logger = logging.getLogger("sms.slow_queries")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = RotatingFileHandler(
+            os.path.join(LOG_DIR, "slow_queries.log"),
+            maxBytes=int(os.getenv("DB_SLOW_LOG_BYTES", str(5 * 1024 * 1024))),
+            backupCount=int(os.getenv("DB_SLOW_LOG_BACKUPS", "5")),
+            encoding="utf-8",
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+        _slow_logger = logger
+    return _slow_logger
+
+
+def add_listener(callback):
+    """Call ``callback(query, elapsed_ms, rows, acquire_ms, error)`` for every statement"""
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def record(query, elapsed_ms, rows=0, acquire_ms=0.0, error=None):
+    """Record one executed statement"""
+    text = fingerprint(query)
+
+    with _lock:
+        entry = _stats.get(text)
+        if entry is None:
+            entry = _stats[text] = {
+                "count": 0,
+                "errors": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "rows": 0,
+                "acquire_ms": 0.0,
+                "samples": deque(maxlen=SAMPLES_PER_QUERY),
+            }
+        entry["count"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        entry["rows"] += rows
+        entry["acquire_ms"] += acquire_ms
+        entry["samples"].append(elapsed_ms)
+        if error is not None:
+            entry["errors"] += 1
+
+    for callback in _listeners:
+        callback(query, elapsed_ms, rows, acquire_ms, error)
+
+    if elapsed_ms >= SLOW_QUERY_MS or error is not None:
+        _get_slow_logger().info(json.dumps({
+            "fingerprint_id": fingerprint_id(text),
+            "ms": round(elapsed_ms, 2),
+            "acquire_ms": round(acquire_ms, 2),
+            "rows": rows,
+            "error": str(error) if error is not None else None,
+            "query": text,
+        }))
+
+    _maybe_dump()
+
+
+@contextmanager
+def timed(query, acquire_ms=0.0):
+    """Record latency, row count and errors for one statement.
+
+    The block sets ``timing["rows"]`` on the yielded dict; an exception
+    raised inside it is recorded as the statement's error and re-raised.
+    """
+    timing = {"rows": 0}
+    started = time.perf_counter()
+    error = None
+    try:
+        yield timing
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        record(query, (time.perf_counter() - started) * 1000, timing["rows"], acquire_ms, error)
+
+
+def _percentile(sorted_samples, pct):
+    if not sorted_samples:
+        return 0.0
+    index = max(0, min(len(sorted_samples) - 1, int(round(pct / 100 * len(sorted_samples))) - 1))
+    return sorted_samples[index]
+
+
+def snapshot():
+    """Return per-fingerprint aggregates with p50/p95/p99 latencies"""
+    with _lock:
+        items = [(text, dict(entry, samples=sorted(entry["samples"]))) for text, entry in _stats.items()]
+
+    result = []
+    for text, entry in items:
+        samples = entry["samples"]
+        count = entry["count"]
+        result.append({
+            "fingerprint_id": fingerprint_id(text),
+            "query": text,
+            "count": count,
+            "errors": entry["errors"],
+            "total_ms": round(entry["total_ms"], 2),
+            "avg_ms": round(entry["total_ms"] / count, 2) if count else 0.0,
+            "p50_ms": round(_percentile(samples, 50), 2),
+            "p95_ms": round(_percentile(samples, 95), 2),
+            "p99_ms": round(_percentile(samples, 99), 2),
+            "max_ms": round(entry["max_ms"], 2),
+            "avg_rows": round(entry["rows"] / count, 1) if count else 0.0,
+            "avg_acquire_ms": round(entry["acquire_ms"] / count, 2) if count else 0.0,
+        })
+    return result
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def dump(path=STATS_FILE):
+    """Write the current aggregates to ``path`` as JSON"""
+    data = snapshot()
+    if not data:
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"pid": os.getpid(), "written_at": time.time(), "queries": data}, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _maybe_dump():
+    global _last_dump
+    now = time.monotonic()
+    if now - _last_dump < DUMP_INTERVAL:
+        return
+    with _lock:
+        if now - _last_dump < DUMP_INTERVAL:
+            return
+        _last_dump = now
+    try:
+        dump()
+    except OSError as e:
+        print(f"❌ Could not write query stats: {e}")
+
+
+atexit.register(lambda: dump() if _stats else None)
+
+
+def print_report(queries, sort="p95", top=20):
+    key = {"p95": "p95_ms", "p99": "p99_ms", "total": "total_ms", "count": "count", "avg": "avg_ms"}[sort]
+    queries = sorted(queries, key=lambda q: q[key], reverse=True)[:top]
+
+    print(f"{'id':<12} {'count':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'total':>10} {'rows':>7} {'acq':>6}  query")
+    for q in queries:
+        print(
+            f"{q['fingerprint_id']:<12} {q['count']:>7} {q['p50_ms']:>8.1f} {q['p95_ms']:>8.1f} "
+            f"{q['p99_ms']:>8.1f} {q['total_ms']:>10.1f} {q['avg_rows']:>7.1f} {q['avg_acquire_ms']:>6.1f}  "
+            f"{q['query'][:90]}"
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show per-query latency aggregates")
+    parser.add_argument("--file", default=STATS_FILE, help="stats file written by the app")
+    parser.add_argument("--sort", default="p95", choices=["p95", "p99", "total", "count", "avg"])
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.file):
+        print(f"❌ No stats file at {args.file}. Run the app first (dumped every {DUMP_INTERVAL:.0f}s).")
+        sys.exit(1)
+
+    with open(args.file, encoding="utf-8") as f:
+        data = json.load(f)
+    age = time.time() - data["written_at"]
+    print(f"📊 Query stats from pid {data['pid']}, written {age:.0f}s ago\n")
+    print_report(data["queries"], sort=args.sort, top=args.top)
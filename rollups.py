@@ -0,0 +1,131 @@
+# rollups.py - Summary tables for attendance and fee totals
+"""
+``attendance_monthly`` holds present/absent counts per student per month
+and ``fee_totals`` holds record counts and amounts per status and fee type.
+The dashboards read these instead of scanning the raw tables.
+
+Every write path that changes attendance or fees calls the matching helper
+inside the same transaction, so a rollup never disagrees with the rows it
+summarizes:
+
+    with transaction() as tx:
+        tx.execute_many(UPSERT_ATTENDANCE, records)
+        rollups.refresh_attendance(tx, student_ids, attendance_date)
+
+Attendance is upserted, so the old status of a re-marked row is unknown;
+the affected student-months are recomputed instead, which reads at most a
+month of rows per student through the (student_id, date) index. Fee
+changes are applied as deltas.
+
+    python rollups.py rebuild    # recompute both tables from raw rows
+"""
+import datetime
+import sys
+
+from config import transaction
+
+UNSPECIFIED = ""  # stored for NULL status / fee_type
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def next_month(day):
+    first = month_start(day)
+    return (first + datetime.timedelta(days=32)).replace(day=1)
+
+
+# -------------------------------------------------------------
+# Attendance
+# -------------------------------------------------------------
+def refresh_attendance(tx, student_ids, day):
+    """Recompute the month containing ``day`` for ``student_ids``"""
+    student_ids = sorted(set(student_ids))
+    if not student_ids:
+        return 0
+    month = month_start(day)
+    marks = ", ".join(["%s"] * len(student_ids))
+    return tx.execute(f"""
+        INSERT INTO attendance_monthly (student_id, month, present, absent)
+        SELECT student_id, %s,
+               SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN status = 'Present' THEN 0 ELSE 1 END)
+        FROM attendance
+        WHERE student_id IN ({marks}) AND date >= %s AND date < %s
+        GROUP BY student_id
+        ON DUPLICATE KEY UPDATE present = VALUES(present), absent = VALUES(absent)
+    """, (month, *student_ids, month, next_month(day)))
+
+
+# -------------------------------------------------------------
+# Fees
+# -------------------------------------------------------------
+def apply_fee_delta(tx, status, fee_type, records, amount):
+    """Add ``records`` rows totalling ``amount`` (negative to remove)"""
+    tx.execute("""
+        INSERT INTO fee_totals (status, fee_type, records, total)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE records = records + VALUES(records), total = total + VALUES(total)
+    """, (status or UNSPECIFIED, fee_type or UNSPECIFIED, records, amount or 0))
+
+
+def add_fee(tx, status, fee_type, amount):
+    apply_fee_delta(tx, status, fee_type, 1, amount)
+
+
+def remove_fees(tx, where, params):
+    """Subtract the fee rows matching ``where`` before they are changed or deleted"""
+    groups = tx.fetch(f"""
+        SELECT status, fee_type, COUNT(*), COALESCE(SUM(amount), 0)
+        FROM fees WHERE {where}
+        GROUP BY status, fee_type
+        FOR UPDATE
+    """, params)
+    for status, fee_type, records, amount in groups:
+        apply_fee_delta(tx, status, fee_type, -records, -amount)
+    return sum(g[2] for g in groups)
+
+
+def remove_student(tx, student_id, student_name):
+    """Drop a student's contribution; call before deleting their rows"""
+    remove_fees(tx, "student_name = %s", (student_name,))
+    tx.execute("DELETE FROM attendance_monthly WHERE student_id = %s", (student_id,))
+
+
+# -------------------------------------------------------------
+# Rebuild
+# -------------------------------------------------------------
+def rebuild(tx):
+    """Recompute both rollups from the raw tables inside ``tx``"""
+    tx.execute("DELETE FROM attendance_monthly")
+    attendance = tx.execute("""
+        INSERT INTO attendance_monthly (student_id, month, present, absent)
+        SELECT student_id, DATE_FORMAT(date, '%Y-%m-01'),
+               SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN status = 'Present' THEN 0 ELSE 1 END)
+        FROM attendance
+        WHERE student_id IS NOT NULL AND date IS NOT NULL
+        GROUP BY student_id, DATE_FORMAT(date, '%Y-%m-01')
+    """)
+    tx.execute("DELETE FROM fee_totals")
+    fees = tx.execute("""
+        INSERT INTO fee_totals (status, fee_type, records, total)
+        SELECT COALESCE(status, ''), COALESCE(fee_type, ''), COUNT(*), COALESCE(SUM(amount), 0)
+        FROM fees
+        GROUP BY COALESCE(status, ''), COALESCE(fee_type, '')
+    """)
+    return attendance, fees
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["rebuild"]:
+        print("Usage: python rollups.py rebuild")
+        sys.exit(2)
+    try:
+        with transaction() as tx:
+            attendance, fees = rebuild(tx)
+        print(f"✅ Rebuilt attendance_monthly ({attendance} rows) and fee_totals ({fees} rows)")
+    except Exception as e:
+        print(f"❌ Rebuild failed: {e}")
+        sys.exit(1)
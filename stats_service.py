@@ -0,0 +1,56 @@
+# stats_service.py - Overview metrics for the admin pages
+"""
+Computes every headline number shown on the admin overview and System
+Analytics pages in one round trip, and returns it as ``OverviewStats``.
+
+Fee totals come from the rollup table kept by ``rollups.py``; attendance
+is counted from the raw table so every row is included, whatever its
+status or student link. The statement goes through the shared result
+cache, so reruns are served from memory until a write touches one of the
+tables it reads.
+"""
+from typing import NamedTuple
+
+from config import fetch_cached
+
+OVERVIEW_QUERY = """
+    SELECT
+        (SELECT COUNT(*) FROM student_details),
+        (SELECT COUNT(*) FROM faculty_details),
+        (SELECT COUNT(*) FROM faculty_details WHERE department = 'B.Tech'),
+        (SELECT COUNT(*) FROM attendance),
+        (SELECT COALESCE(SUM(total), 0) FROM fee_totals WHERE status = 'Paid'),
+        (SELECT COUNT(DISTINCT course) FROM results),
+        (SELECT COUNT(*) FROM results)
+"""
+
+
+class OverviewStats(NamedTuple):
+    students: int
+    faculty: int
+    btech_faculty: int
+    attendance_records: int
+    fees_collected: float
+    active_subjects: int
+    assignments: int
+
+
+def get_overview_stats(read_only=False):
+    """Return the overview metrics, or None if the database is unreachable.
+
+    ``read_only`` lets analytics pages read them from the replica.
+    """
+    rows = fetch_cached(OVERVIEW_QUERY, read_only=read_only)
+    if not rows:
+        return None
+    (students, faculty, btech_faculty, attendance_records,
+     fees_collected, active_subjects, assignments) = rows[0]
+    return OverviewStats(
+        students=int(students or 0),
+        faculty=int(faculty or 0),
+        btech_faculty=int(btech_faculty or 0),
+        attendance_records=int(attendance_records or 0),
+        fees_collected=float(fees_collected or 0),
+        active_subjects=int(active_subjects or 0),
+        assignments=int(assignments or 0),
+    )
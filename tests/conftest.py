@@ -0,0 +1,137 @@
+# conftest.py - Shared fixtures for the unit tests
+"""
+The tests cover logic that does not need a MySQL server. Modules are
+imported from the repository root; anything that would reach MySQL is
+replaced per test with ``monkeypatch``.
+
+    python -m pytest -q
+"""
+import logging
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import query_stats  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def quiet_query_stats(monkeypatch):
+    """Keep statement stats from writing logs/ while the tests run"""
+    monkeypatch.setattr(query_stats, "_get_slow_logger", lambda: logging.getLogger("tests.slow_queries"))
+    monkeypatch.setattr(query_stats, "_maybe_dump", lambda: None)
+    yield
+    query_stats.reset()
+
+
+class FakeTransaction:
+    """Stands in for ``config.Transaction``; records statements, returns canned rows"""
+
+    def __init__(self, rows=()):
+        self.statements = []
+        self.rows = list(rows)
+
+    def execute(self, query, params=None):
+        self.statements.append((" ".join(query.split()), tuple(params or ())))
+        return 1
+
+    def execute_many(self, query, seq_params, batch_size=None):
+        seq_params = list(seq_params)
+        self.statements.append((" ".join(query.split()), seq_params))
+        return len(seq_params)
+
+    def fetch(self, query, params=None):
+        self.statements.append((" ".join(query.split()), tuple(params or ())))
+        return self.rows
+
+
+@pytest.fixture
+def fake_transaction(monkeypatch):
+    """Patch ``transaction()`` in the given modules; returns the opened transactions"""
+    opened = []
+
+    @contextmanager
+    def transaction():
+        tx = FakeTransaction()
+        opened.append(tx)
+        yield tx
+
+    def install(*modules):
+        for module in modules:
+            monkeypatch.setattr(module, "transaction", transaction)
+        return opened
+    return install
+
+
+class FakeCursor:
+    """Enough of a mysql.connector cursor for the config helpers"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+        self.lastrowid = None
+        self.description = None
+        self._rows = []
+
+    def execute(self, query, params=()):
+        self.conn.statements.append((" ".join(query.split()), tuple(params or ())))
+        if self.conn.fail_with is not None:
+            raise self.conn.fail_with
+        self._rows = list(self.conn.rows)
+        self.rowcount = len(self._rows) or 1
+
+    def executemany(self, query, seq_params):
+        seq_params = list(seq_params)
+        self.conn.statements.append((" ".join(query.split()), seq_params))
+        self.rowcount = len(seq_params)
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Stands in for a mysql.connector connection; every cursor shares ``rows``"""
+
+    def __init__(self, name="primary", rows=()):
+        self.name = name
+        self.rows = list(rows)
+        self.statements = []
+        self.fail_with = None
+        self.in_transaction = False
+        self.closed = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def start_transaction(self):
+        self.in_transaction = True
+
+    def commit(self):
+        self.commits += 1
+        self.in_transaction = False
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        self.closed = True
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+import async_db
+import query_cache
+import query_stats
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+        self.lastrowid = None
+        self.rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=()):
+        self.conn.statements.append((query, tuple(params)))
+        self.rows = list(self.conn.rows)
+        self.rowcount = len(self.rows) or 1
+
+    async def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+        self.commits = 0
+        self.closed = False
+
+    def cursor(self, *args):
+        return FakeCursor(self)
+
+    async def commit(self):
+        self.commits += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+        self.released = []
+
+    async def acquire(self):
+        return self.conn
+
+    def release(self, conn):
+        self.released.append(conn)
+
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+
+class FakeDriver:
+    def __init__(self, conn):
+        self.conn = conn
+        self.created = 0
+
+    async def create_pool(self, **kwargs):
+        self.created += 1
+        await asyncio.sleep(0)  # give waiting tasks a chance to race
+        return FakePool(self.conn)
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    fake = FakeDriver(FakeConnection(rows=[(1,)]))
+    monkeypatch.setattr(async_db, "_driver", lambda: fake)
+    monkeypatch.setattr(async_db, "note_write", lambda: None)
+    return fake
+
+
+def run(coro):
+    async def main():
+        try:
+            return await coro
+        finally:
+            await async_db.close_pool()
+    return asyncio.run(main())
+
+
+def test_concurrent_first_use_creates_one_pool(driver):
+    async def first_use():
+        return await asyncio.gather(*[async_db.get_pool() for _ in range(10)])
+
+    pools = run(first_use())
+    assert driver.created == 1
+    assert all(pool is pools[0] for pool in pools)
+
+
+def test_close_pool_forgets_the_loops_pool_and_lock(driver):
+    run(async_db.get_pool())
+    assert async_db._pools == {} and async_db._create_locks == {}
+
+
+def test_fetch_returns_rows_and_records_the_statement(driver):
+    assert run(async_db.fetch("SELECT id FROM results WHERE id=%s", (7,))) == [(1,)]
+    assert driver.conn.statements == [("SELECT id FROM results WHERE id=%s", (7,))]
+    assert driver.conn.closed is False
+    [entry] = query_stats.snapshot()
+    assert entry["query"] == "SELECT id FROM results WHERE id=?" and entry["avg_rows"] == 1.0
+
+
+def test_execute_commits_and_invalidates_written_tables(driver, monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(query_cache, "invalidate_tables", invalidated.append)
+    assert run(async_db.execute("UPDATE results SET grade=%s WHERE id=%s", ("A", 7))) == 1
+    assert driver.conn.commits == 1
+    assert invalidated == [{"results"}]
+
+
+def test_gather_keeps_query_order(driver):
+    queries = [("SELECT %s", (n,)) for n in range(5)]
+    assert run(async_db.gather(queries, limit=2)) == [[(1,)]] * 5
+    assert [params for _, params in driver.conn.statements] == [(n,) for n in range(5)]
+
+
+def test_a_failed_statement_closes_its_connection(driver):
+    async def broken(*args):
+        raise RuntimeError("lost connection")
+
+    driver.conn.cursor = lambda *args: type("Broken", (FakeCursor,), {"execute": broken})(driver.conn)
+    with pytest.raises(RuntimeError, match="lost connection"):
+        run(async_db.fetch("SELECT 1"))
+    assert driver.conn.closed
+    assert query_stats.snapshot()[0]["errors"] == 1
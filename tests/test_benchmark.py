@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+import benchmark
+import generate_data
+
+
+@pytest.fixture(scope="module")
+def loaded():
+    backend = benchmark.SQLiteBackend()
+    backend.load(generate_data.generate_dataset(300, 60, 10, 42, end_date=benchmark.BENCH_DATE))
+    yield backend
+    backend.close()
+
+
+@pytest.mark.parametrize("path", list(benchmark.QUERY_PATHS))
+def test_every_query_path_runs_on_sqlite(loaded, path):
+    ctx = benchmark.build_context(loaded)
+    elapsed, statements, rows = benchmark.run_path(loaded, benchmark.QUERY_PATHS[path], ctx)
+    assert statements >= 1
+    assert elapsed >= 0
+
+
+class ExistingDatabase:
+    """A backend that must be measured as-is, like MySQL without --load"""
+
+    name = "mysql"
+    reloads = False
+
+    def __init__(self, backend):
+        self._backend = backend
+
+    def reset(self):
+        pytest.fail("existing data was reset")
+
+    def load(self, dataset):
+        pytest.fail("existing data was reloaded")
+
+    def execute(self, sql, params=()):
+        return self._backend.execute(sql, params)
+
+    def close(self):
+        pass
+
+
+def test_existing_database_is_measured_without_reloading(loaded, monkeypatch, tmp_path):
+    monkeypatch.setattr(benchmark, "MySQLBackend", lambda load=False: ExistingDatabase(loaded))
+    output = tmp_path / "run.json"
+    assert benchmark.main(["--backend", "mysql", "--repeat", "1", "--paths", "login", "--output", str(output)]) == 0
+    [result] = json.loads(output.read_text())["results"]
+    assert (result["path"], result["students"]) == ("login", 300)
+
+
+def test_compare_matches_runs_by_path_and_size(tmp_path, capsys):
+    def run(revision, ms):
+        path = tmp_path / f"{revision}.json"
+        path.write_text(json.dumps({"revision": revision, "backend": "sqlite", "results": [
+            {"path": "login", "students": 1000, "median_ms": ms, "statements": 1}]}))
+        return str(path)
+    benchmark.compare(run("old", 2.0), run("new", 1.0))
+    assert "-50%" in capsys.readouterr().out
@@ -0,0 +1,96 @@
+import io
+
+import pytest
+
+import bulk_import
+
+HEADER = "Name,Age,Sex,Phone No,Username,Password\r\n"
+
+
+def csv_file(text):
+    return io.BytesIO(("﻿" + text).encode("utf-8"))
+
+
+def person(**overrides):
+    row = {"name": "Asha", "age": "19", "sex": "female", "phoneno": "98765 43210",
+           "username": "asha", "password": "secret1"}
+    row.update(overrides)
+    return row
+
+
+def test_read_rows_cleans_header_and_skips_blank_lines():
+    rows = bulk_import.read_rows(csv_file(HEADER + "Asha,19,F,1,a,p\r\n,,,,,\r\nRavi,20,M,2,r,p\r\n"), "x.csv")
+    assert next(rows) == ["name", "age", "sex", "phone_no", "username", "password"]
+    assert [number for number, _ in rows] == [2, 4]
+
+
+def test_missing_columns():
+    assert bulk_import.missing_columns("students", ["name", "age", "phoneno"]) == ["sex", "username", "password"]
+    assert bulk_import.missing_columns("enrollments", ["student_username", "faculty_username", "course"]) == []
+
+
+def test_valid_student_is_normalized():
+    row = person(age="19.0")
+    assert bulk_import._validate_person("students", row) is None
+    assert (row["age"], row["sex"], row["phoneno"]) == (19, "Female", "9876543210")
+
+
+@pytest.mark.parametrize("overrides, error", [
+    ({"name": ""}, "missing name"),
+    ({"phoneno": "98-76"}, "invalid phone '98-76'"),
+    ({"phoneno": "1" * 16}, "invalid phone"),
+    ({"age": "nineteen"}, "invalid age 'nineteen'"),
+    ({"age": "nan"}, "invalid age 'nan'"),
+    ({"age": "inf"}, "invalid age 'inf'"),
+    ({"age": "4"}, "age 4 out of range"),
+    ({"sex": "x"}, "invalid sex 'x'"),
+])
+def test_invalid_student_rows(overrides, error):
+    assert bulk_import._validate_person("students", person(**overrides)).startswith(error)
+
+
+def test_faculty_password_length():
+    row = {"name": "Dr Rao", "department": "B.Tech", "phoneno": "9000000001",
+           "username": "rao", "password": "abc"}
+    assert bulk_import._validate_person("faculty", row) == "password must be at least 6 characters"
+
+
+def test_chunks():
+    assert list(bulk_import._chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_import_rejects_missing_columns():
+    with pytest.raises(ValueError, match="Missing column"):
+        list(bulk_import.import_file("students", csv_file("name,age\r\nAsha,19\r\n"), "x.csv"))
+
+
+def test_header_only_file_yields_no_rows(monkeypatch):
+    monkeypatch.setattr(bulk_import, "fetch_details", lambda *a, **k: pytest.fail("queried"))
+    reports = list(bulk_import.import_file("students", csv_file("name,age,sex,phoneno,username,password\r\n"),
+                                           "x.csv"))
+    assert all(report.rows == 0 for report in reports)
+
+
+def test_import_screens_file_and_database_duplicates(fake_transaction, monkeypatch):
+    taken = {"login_details": [("taken",)], "student_details": [("9000000005",)]}
+    monkeypatch.setattr(bulk_import, "fetch_details",
+                        lambda query, params=None: next(v for k, v in taken.items() if k in query))
+    monkeypatch.setattr(bulk_import, "_ids_by_phone",
+                        lambda tx, table, phones: {p: i for i, p in enumerate(phones, start=100)})
+    opened = fake_transaction(bulk_import)
+    text = "name,age,sex,phoneno,username,password\r\n" + "".join(f"{line}\r\n" for line in [
+        "Asha,19,Female,9000000001,asha,secret1",
+        "Ravi,20,Male,9000000002,taken,secret1",     # username in the database
+        "Zoya,21,Female,9000000001,zoya,secret1",    # phone repeated in file
+        "Ben,22,Male,9000000004,asha,secret1",       # username repeated in file
+        "Chen,23,Male,9000000005,chen,secret1",      # phone in the database
+        "Dev,,Male,9000000006,dev,secret1",          # missing age
+        "Esha,24,Female,9000000007,esha,secret1",
+    ])
+
+    *_, report = bulk_import.import_file("students", csv_file(text), "x.csv", chunk_size=4)
+
+    assert (report.rows, report.inserted) == (7, 2)
+    assert [number for number, _ in sorted(report.errors)] == [3, 4, 5, 6, 7]
+    inserted = [row for tx in opened for sql, rows in tx.statements if "student_details" in sql for row in rows]
+    assert [row[0] for row in inserted] == ["Asha", "Esha"]
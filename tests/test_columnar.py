@@ -0,0 +1,47 @@
+import datetime
+from decimal import Decimal
+
+import pandas as pd
+
+import config
+
+COLUMNS = [("name", "str"), ("marks", "int"), ("gpa", "float"), ("on", "date")]
+
+
+def test_rows_to_frame_types_columns_and_keeps_integer_nulls():
+    rows = [
+        ("Asha", 91, Decimal("8.75"), datetime.date(2025, 6, 21)),
+        ("Ravi", None, None, datetime.datetime(2025, 6, 23, 9, 30)),
+    ]
+    frame = config.rows_to_frame(rows, COLUMNS)
+
+    assert list(frame.columns) == ["name", "marks", "gpa", "on"]
+    assert str(frame["marks"].dtype) == "Int64"
+    assert frame["marks"].iloc[0] == 91 and frame["marks"].isna().iloc[1]
+    assert frame["gpa"].dtype == "float64" and frame["gpa"].iloc[0] == 8.75
+    assert pd.isna(frame["gpa"].iloc[1])
+    assert frame["on"].dtype == "datetime64[ns]"
+    assert frame["on"].iloc[1] == pd.Timestamp("2025-06-23 09:30")
+
+
+def test_rows_to_frame_with_no_rows_keeps_column_types():
+    frame = config.rows_to_frame([], COLUMNS)
+    assert len(frame) == 0
+    assert [str(t) for t in frame.dtypes] == ["object", "Int64", "float64", "datetime64[ns]"]
+
+
+def test_chunks_are_concatenated_in_order():
+    chunks = [[(1, "a"), (2, "b")], [(3, None)]]
+    frame = config._frame_from_chunks(chunks, [("id", "int"), ("label", "str")])
+    assert frame["id"].tolist() == [1, 2, 3]
+    assert frame["label"].tolist()[:2] == ["a", "b"] and pd.isna(frame["label"].iloc[2])
+
+
+def test_fetch_dataframe_returns_none_when_the_query_fails(monkeypatch, capsys):
+    def broken(*args, **kwargs):
+        raise RuntimeError("server gone")
+        yield
+
+    monkeypatch.setattr(config, "stream_chunks", broken)
+    assert config.fetch_dataframe("SELECT 1", [("one", "int")]) is None
+    assert "server gone" in capsys.readouterr().out
@@ -0,0 +1,131 @@
+import pytest
+
+import config
+from conftest import FakeConnection
+
+
+def make_pool(size=2, timeout=0.05, **kwargs):
+    opened = []
+
+    def connect():
+        conn = FakeConnection()
+        opened.append(conn)
+        return conn
+    return config.ConnectionPool(connect, size=size, timeout=timeout, **kwargs), opened
+
+
+def test_pool_reuses_released_connections():
+    pool, opened = make_pool()
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+    assert len(opened) == 1
+
+
+def test_pool_waits_then_gives_up_when_exhausted():
+    pool, _ = make_pool(size=1)
+    pool.acquire()
+    assert pool.acquire() is None
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_pool_discards_broken_connections():
+    pool, opened = make_pool(size=1)
+    conn = pool.acquire()
+    pool.release(conn, discard=True)
+    assert conn.closed
+    assert pool.acquire() is not conn
+    stats = pool.stats()
+    assert (stats["open"], stats["in_use"], stats["discarded"]) == (1, 1, 1)
+
+
+def test_pool_rolls_back_open_transactions_on_release():
+    pool, _ = make_pool()
+    conn = pool.acquire()
+    conn.start_transaction()
+    pool.release(conn)
+    assert conn.rollbacks == 1
+
+
+def test_pool_frees_the_slot_when_connecting_fails():
+    pool = config.ConnectionPool(lambda: None, size=1, timeout=0.05)
+    assert pool.acquire() is None
+    stats = pool.stats()
+    assert (stats["open"], stats["in_use"]) == (0, 0)
+
+
+def test_pool_closes_connections_idle_too_long():
+    pool, _ = make_pool(max_idle=0.0)
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is not conn
+    assert conn.closed
+
+
+@pytest.fixture
+def primary(monkeypatch):
+    """Route the module-level helpers to a one-connection pool of fakes"""
+    conn = FakeConnection()
+    pool = config.ConnectionPool(lambda: conn, size=1, timeout=0.05)
+    monkeypatch.setattr(config, "_pool", pool)
+    return conn
+
+
+def test_fetch_details_returns_none_on_errors(primary):
+    primary.fail_with = RuntimeError("syntax error")
+    assert config.fetch_details("SELECT broken") is None
+    assert config.get_pool().stats()["in_use"] == 0
+
+
+def test_transaction_commits_once_and_invalidates_written_tables(primary, monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(config.query_cache, "invalidate_tables", lambda tables: invalidated.append(set(tables)))
+    with config.transaction() as tx:
+        tx.execute("INSERT INTO student_details (name) VALUES (%s)", ("Asha",))
+        tx.execute("UPDATE login_details SET user_id=%s", (1,))
+    assert (primary.commits, primary.rollbacks) == (1, 0)
+    assert invalidated == [{"student_details", "login_details"}]
+
+
+def test_transaction_rolls_back_when_the_block_raises(primary, monkeypatch):
+    monkeypatch.setattr(config.query_cache, "invalidate_tables", lambda tables: pytest.fail("invalidated"))
+    with pytest.raises(ValueError):
+        with config.transaction() as tx:
+            tx.execute("DELETE FROM fees WHERE id=%s", (1,))
+            raise ValueError("stop")
+    assert (primary.commits, primary.rollbacks) == (0, 1)
+    assert config.get_pool().stats()["in_use"] == 0
+
+
+def test_execute_many_sends_fixed_size_batches_from_any_iterable(primary):
+    rows = ((i, f"name{i}") for i in range(7))
+    assert config.execute_many("INSERT INTO student_details (id, name) VALUES (%s, %s)", rows, batch_size=3)
+    assert [len(params) for _, params in primary.statements] == [3, 3, 1]
+    assert primary.commits == 1
+
+
+def test_execute_many_reports_failure(primary):
+    config.get_pool().size = 0  # no connection can be borrowed
+    assert config.execute_many("INSERT INTO fees (id) VALUES (%s)", [(1,)]) is False
+
+
+def test_stream_chunks_returns_a_drained_connection_to_the_pool(primary):
+    primary.rows = [(i,) for i in range(5)]
+    assert [len(chunk) for chunk in config.stream_chunks("SELECT id FROM attendance", size=2)] == [2, 2, 1]
+    stats = config.get_pool().stats()
+    assert (stats["in_use"], stats["idle"], stats["discarded"]) == (0, 1, 0)
+
+
+def test_stream_chunks_discards_a_connection_left_mid_result(primary):
+    primary.rows = [(i,) for i in range(5)]
+    chunks = config.stream_chunks("SELECT id FROM attendance", size=2)
+    next(chunks)
+    chunks.close()
+    stats = config.get_pool().stats()
+    assert (stats["in_use"], stats["idle"], stats["discarded"]) == (0, 0, 1)
+    assert primary.closed
+
+
+def test_stream_rows_flattens_chunks(primary):
+    primary.rows = [(i,) for i in range(3)]
+    assert list(config.stream_rows("SELECT id FROM attendance", size=2)) == [(0,), (1,), (2,)]
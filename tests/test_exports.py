@@ -0,0 +1,91 @@
+import csv
+import datetime
+import os
+from decimal import Decimal
+
+import pytest
+
+import exports
+
+ROWS = [("Asha", "Tuition", Decimal("1500.50"), datetime.date(2025, 6, 1), "Paid"),
+        ("Ravi", "Library", None, None, "Pending")]
+
+
+@pytest.fixture
+def streamed(monkeypatch):
+    """Serve two chunks for any report and record how the stream was used"""
+    calls = []
+
+    def stream_chunks(query, params=None, size=None, read_only=False):
+        calls.append({"query": query, "params": params, "read_only": read_only, "closed": False})
+        try:
+            yield ROWS[:1]
+            yield ROWS[1:]
+        finally:
+            calls[-1]["closed"] = True
+
+    monkeypatch.setattr(exports, "stream_chunks", stream_chunks)
+    return calls
+
+
+def test_report_query_applies_allowed_filters():
+    query, params = exports.report_query("faculty_performance", {"department": "B.Tech"})
+    assert "WHERE f.department = %s" in query and params == ("B.Tech",)
+    query, params = exports.report_query("faculty_performance")
+    assert "{where}" not in query and "WHERE" not in query and params == ()
+
+
+@pytest.mark.parametrize("name, filters, error", [
+    ("grades", {"department": "B.Tech"}, "cannot be filtered"),
+    ("faculty_performance", {"course": "CS"}, "cannot be filtered"),
+    ("missing", None, "Unknown report"),
+])
+def test_report_query_rejects_unknown_reports_and_filters(name, filters, error):
+    with pytest.raises(ValueError, match=error):
+        exports.report_query(name, filters)
+
+
+def test_write_csv_streams_every_chunk_from_the_replica(streamed, tmp_path):
+    path = tmp_path / "fees.csv"
+    assert exports.write_report("fees", "csv", str(path)) == 2
+    with open(path, newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f)) == [
+            ["Student", "Fee Type", "Amount", "Due Date", "Status"],
+            ["Asha", "Tuition", "1500.50", "2025-06-01", "Paid"],
+            ["Ravi", "Library", "", "", "Pending"],
+        ]
+    assert streamed[0]["read_only"] and streamed[0]["closed"]
+
+
+def test_write_parquet_uses_the_report_schema(streamed, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "fees.parquet"
+    assert exports.write_report("fees", "parquet", str(path)) == 2
+    table = pq.read_table(path)
+    assert table.column_names == ["Student", "Fee Type", "Amount", "Due Date", "Status"]
+    assert table.column("Amount").to_pylist() == [1500.5, None]
+    assert table.column("Due Date").to_pylist() == [datetime.date(2025, 6, 1), None]
+
+
+def test_unknown_format_is_rejected(streamed, tmp_path):
+    with pytest.raises(ValueError, match="Unknown format"):
+        exports.write_report("fees", "xlsx", str(tmp_path / "fees.xlsx"))
+
+
+def test_failed_export_removes_its_file(monkeypatch, tmp_path):
+    def stream_chunks(query, params=None, size=None, read_only=False):
+        yield ROWS[:1]
+        raise ConnectionError("lost")
+    monkeypatch.setattr(exports, "stream_chunks", stream_chunks)
+    with pytest.raises(ConnectionError):
+        exports.export("fees", "csv", directory=str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_count_rows_wraps_the_filtered_report(monkeypatch):
+    seen = []
+    monkeypatch.setattr(exports, "fetch_details",
+                        lambda query, params=None, read_only=False: seen.append((query, params, read_only)) or [(42,)])
+    assert exports.count_rows("faculty_performance", {"department": "MBA"}) == 42
+    query, params, read_only = seen[0]
+    assert query.startswith("SELECT COUNT(*) FROM (") and params == ("MBA",) and read_only
@@ -0,0 +1,98 @@
+import datetime
+
+import pytest
+
+import faculty_dashboard
+import gpa
+
+
+def test_save_grade_changes_writes_one_case_update(fake_transaction, monkeypatch):
+    opened = fake_transaction(faculty_dashboard)
+    refreshed = []
+    monkeypatch.setattr(gpa, "refresh", lambda tx, students, faculty: refreshed.append((students, faculty)))
+
+    faculty_dashboard.save_grade_changes(7, [(101, 1, "A"), (102, 2, None)])
+
+    [tx] = opened
+    [(sql, params)] = tx.statements
+    assert "SET grade = CASE id WHEN %s THEN %s WHEN %s THEN %s END" in sql
+    assert "WHERE faculty_id = %s AND id IN (%s, %s)" in sql
+    assert params == (101, "A", 102, None, 7, 101, 102)
+    assert refreshed == [([1, 2], [7])]
+
+
+def test_save_grade_changes_without_changes_opens_no_transaction(fake_transaction):
+    opened = fake_transaction(faculty_dashboard)
+    assert faculty_dashboard.save_grade_changes(7, []) == 0
+    assert opened == []
+
+
+MON = datetime.date(2025, 3, 31)
+TUE = datetime.date(2025, 4, 1)
+
+
+def test_diff_attendance_splits_new_changed_and_unchanged():
+    existing = {(1, MON): "Present", (2, MON): "Absent"}
+    marked = [(1, "Asha", MON, "Present"), (2, "Ravi", MON, "Present"), (3, "Zoya", MON, "Absent")]
+    new, changed = faculty_dashboard.diff_attendance(existing, marked)
+    assert new == [(3, "Zoya", MON, "Absent")]
+    assert changed == [(2, "Ravi", MON, "Present", "Absent")]
+
+
+def test_save_attendance_changes_refreshes_each_touched_month(fake_transaction, monkeypatch):
+    opened = fake_transaction(faculty_dashboard)
+    refreshed = []
+    monkeypatch.setattr(faculty_dashboard.rollups, "refresh_attendance",
+                        lambda tx, ids, month: refreshed.append((month, sorted(ids))))
+    records = [(1, "Asha", MON, "Present"), (2, "Ravi", TUE, "Absent"), (1, "Asha", TUE, "Absent")]
+
+    faculty_dashboard.save_attendance_changes(records)
+
+    [tx] = opened
+    [(sql, rows)] = tx.statements
+    assert sql.startswith("INSERT INTO attendance") and "ON DUPLICATE KEY UPDATE" in sql
+    assert rows == records
+    assert sorted(refreshed) == [(datetime.date(2025, 3, 1), [1]), (datetime.date(2025, 4, 1), [1, 2])]
+
+
+def test_load_attendance_without_students_skips_the_query(monkeypatch):
+    monkeypatch.setattr(faculty_dashboard, "fetch_details", lambda *a, **k: pytest.fail("queried"))
+    assert faculty_dashboard.load_attendance([], [MON]) == {}
+
+
+def grid(students, existing):
+    dates, labels = [MON, TUE], ["Mon", "Tue"]
+    return faculty_dashboard._new_grid(students, dates, labels, existing, version=0), dates, labels
+
+
+def test_grid_edits_keep_only_cells_changed_from_the_baseline():
+    baseline = {(1, MON): "Present", (2, MON): "Absent"}
+    g, dates, labels = grid([(1, "Asha"), (2, "Ravi")], baseline)
+    frame = g["frame"]
+    frame.loc[0, "Tue"] = "Absent"  # new mark
+    frame.loc[1, "Mon"] = "Present"  # re-mark
+    edits, conflicts = faculty_dashboard.grid_edits(frame, dates, labels, g["baseline"], baseline)
+    assert edits == [(1, "Asha", TUE, "Absent"), (2, "Ravi", MON, "Present")]
+    assert conflicts == []
+
+
+def test_grid_edits_never_revert_marks_saved_elsewhere():
+    baseline = {(1, MON): "Present"}
+    g, dates, labels = grid([(1, "Asha"), (2, "Ravi")], baseline)
+    # Someone else marks Ravi and changes Asha while this grid is open, unedited here
+    existing = {(1, MON): "Absent", (2, TUE): "Present"}
+    edits, conflicts = faculty_dashboard.grid_edits(g["frame"], dates, labels, g["baseline"], existing)
+    assert edits == [] and conflicts == []
+
+
+def test_grid_edits_report_cells_changed_underneath_as_conflicts():
+    baseline = {(1, MON): "Present", (2, MON): "Present"}
+    g, dates, labels = grid([(1, "Asha"), (2, "Ravi")], baseline)
+    frame = g["frame"]
+    frame.loc[0, "Mon"] = "Absent"
+    frame.loc[1, "Mon"] = "Absent"
+    existing = {(1, MON): "Late", (2, MON): "Absent"}  # Asha moved to a third value; Ravi agrees
+    edits, conflicts = faculty_dashboard.grid_edits(frame, dates, labels, g["baseline"], existing)
+    assert conflicts == [(1, "Asha", MON, "Absent")]
+    assert edits == [(2, "Ravi", MON, "Absent")]
+    assert faculty_dashboard.diff_attendance(existing, edits) == ([], [])
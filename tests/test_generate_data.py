@@ -0,0 +1,56 @@
+import datetime
+
+import pytest
+
+import generate_data
+
+END = datetime.date(2025, 6, 30)
+
+
+def dataset(students=40, faculty=60, days=10, seed=7):
+    return {table: (columns, list(rows)) for table, columns, rows in
+            generate_data.generate_dataset(students, faculty, days, seed, end_date=END)}
+
+
+def test_same_seed_gives_the_same_data():
+    assert dataset() == dataset()
+    assert dataset(seed=8)["student_details"] != dataset()["student_details"]
+
+
+def test_tables_come_in_foreign_key_order():
+    assert list(dataset()) == generate_data.TABLES
+
+
+def test_rows_match_their_columns_and_counts():
+    data = dataset(students=40, faculty=60, days=10)
+    for table, (columns, rows) in data.items():
+        assert all(len(row) == len(columns) for row in rows), table
+    assert len(data["student_details"][1]) == 40
+    assert len(data["faculty_details"][1]) == 60
+    assert len(data["login_details"][1]) == 1 + 60 + 40
+    # 21-30 June 2025 holds six weekdays
+    assert len(data["attendance"][1]) == 40 * 6
+
+
+def test_generated_keys_are_unique():
+    data = dataset()
+    logins = [row[0] for row in data["login_details"][1]]
+    phones = [row[4] for row in data["student_details"][1]] + [row[3] for row in data["faculty_details"][1]]
+    attendance = [(row[0], row[2]) for row in data["attendance"][1]]
+    for values in (logins, phones, attendance):
+        assert len(values) == len(set(values))
+
+
+def test_every_result_is_taught_by_faculty_of_that_course():
+    data = dataset()
+    teaches = {(row[0], row[1]) for row in data["faculty_teaching"][1]}
+    assert all((faculty_id, course) in teaches for _, faculty_id, course, _ in data["results"][1])
+
+
+def test_too_few_faculty_to_cover_every_subject():
+    with pytest.raises(ValueError, match="Need at least"):
+        generate_data.plan(10, 1, 42)
+
+
+def test_insert_sql():
+    assert generate_data.insert_sql("fees", ["a", "b"], "?") == "INSERT INTO fees (a, b) VALUES (?, ?)"
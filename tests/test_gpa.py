@@ -0,0 +1,51 @@
+import sqlite3
+
+import pytest
+
+import gpa
+from conftest import FakeTransaction
+
+
+@pytest.fixture
+def results_db():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE results (student_id INTEGER, faculty_id INTEGER, course TEXT, grade TEXT)")
+    conn.executemany("INSERT INTO results VALUES (?, ?, ?, ?)", [
+        (1, 10, "CS", "A"), (1, 10, "ME", "B+"), (1, 11, "EE", None),
+        (2, 10, "CS", "F"), (2, 11, "EE", "C-"),
+        (3, 11, "EE", "Incomplete"),
+    ])
+    yield conn
+    conn.close()
+
+
+def test_points_sql_covers_every_grade(results_db):
+    for grade, points in gpa.GRADE_POINTS.items():
+        assert results_db.execute(f"SELECT {gpa.points_sql(repr(grade))}").fetchone() == (points,)
+    assert results_db.execute(f"SELECT {gpa.points_sql(repr('Z'))}").fetchone() == (None,)
+
+
+def test_student_select_ignores_ungraded_and_unknown_grades(results_db):
+    rows = {r[0]: r[1:] for r in results_db.execute(gpa._student_select())}
+    assert rows[1] == (2, 7.3, pytest.approx(3.65))
+    assert rows[2] == (2, pytest.approx(1.7), pytest.approx(0.85))
+    assert rows[3] == (0, 0, None)
+
+
+def test_faculty_select_counts_students_courses_and_grades(results_db):
+    rows = {r[0]: r[1:] for r in results_db.execute(gpa._faculty_select())}
+    assert rows[10] == (2, 2, 3, pytest.approx((4.0 + 3.3 + 0.0) / 3))
+    assert rows[11] == (3, 1, 1, pytest.approx(1.7))
+
+
+def test_refresh_touches_each_id_once():
+    tx = FakeTransaction()
+    gpa.refresh(tx, [3, 1, 3], [])
+    delete, insert = tx.statements
+    assert delete == ("DELETE FROM student_gpa WHERE student_id IN (%s, %s)", (1, 3))
+    assert insert[1] == (1, 3)
+
+
+def test_affected_skips_null_ids():
+    tx = FakeTransaction(rows=[(1, 10), (None, 11), (2, None)])
+    assert gpa.affected(tx, "course = %s", ("CS",)) == ({1, 2}, {10, 11})
@@ -0,0 +1,45 @@
+import pytest
+
+import migrate
+
+
+def test_split_statements_drops_comments_and_blank_statements():
+    sql = """-- 001: header comment
+ALTER TABLE a ADD COLUMN x INT;
+
+-- note
+UPDATE a
+SET x = 1
+WHERE x IS NULL;
+;
+SELECT 1"""
+    assert migrate.split_statements(sql) == [
+        "ALTER TABLE a ADD COLUMN x INT",
+        "UPDATE a\nSET x = 1\nWHERE x IS NULL",
+        "SELECT 1",
+    ]
+
+
+def test_discover_migrations_orders_by_version(tmp_path):
+    for name in ["010_later.sql", "002_second.sql", "001_first.sql", "notes.txt", "3_bad-name.sql.bak"]:
+        (tmp_path / name).write_text("SELECT 1;")
+    found = migrate.discover_migrations(str(tmp_path))
+    assert [(v, n) for v, n, _ in found] == [(1, "first"), (2, "second"), (10, "later")]
+
+
+def test_discover_migrations_rejects_duplicate_versions(tmp_path):
+    (tmp_path / "001_a.sql").write_text("SELECT 1;")
+    (tmp_path / "1_b.sql").write_text("SELECT 1;")
+    with pytest.raises(ValueError, match="Duplicate migration versions"):
+        migrate.discover_migrations(str(tmp_path))
+
+
+def test_shipped_migrations_are_discoverable():
+    versions = [v for v, _, _ in migrate.discover_migrations()]
+    assert versions == sorted(versions)
+    assert versions[0] == 1
+
+
+def test_checksum_changes_with_content():
+    assert migrate.checksum("SELECT 1;") == migrate.checksum("SELECT 1;")
+    assert migrate.checksum("SELECT 1;") != migrate.checksum("SELECT 2;")
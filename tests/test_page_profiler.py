@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+import page_profiler
+
+
+@pytest.fixture
+def enabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("SMS_PROFILE", "1")
+    monkeypatch.setattr(page_profiler, "TRACE_FILE", str(tmp_path / "page_trace.jsonl"))
+    monkeypatch.setattr(page_profiler, "_install_hooks", lambda: None)
+    monkeypatch.setattr(page_profiler.st, "session_state", {"username": "admin"})
+    return tmp_path / "page_trace.jsonl"
+
+
+def test_trace_counts_queries_and_widgets():
+    trace = page_profiler.PageTrace("admin")
+    trace.add_query(12.0, 3.0)
+    trace.add_element("button", 1.5)
+    trace.add_element("markdown", 0.5)
+    assert (trace.db_ms, trace.queries) == (15.0, 1)
+    assert (trace.render_ms, trace.elements, trace.widgets) == (2.0, 2, 1)
+
+
+def test_profiling_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("SMS_PROFILE", raising=False)
+    monkeypatch.setattr(page_profiler.st, "query_params", {})
+    with page_profiler.profile_page("admin") as trace:
+        assert trace is None
+
+
+def test_profile_page_attributes_queries_and_writes_a_record(enabled):
+    with page_profiler.profile_page("admin") as trace:
+        page_profiler.label_page("Fees")
+        page_profiler._on_query("SELECT 1", 4.0, 1, 1.0, None)
+    page_profiler._on_query("SELECT 2", 50.0, 1, 0.0, None)  # after the page finished
+
+    assert trace.page == "admin/Fees"
+    [line] = enabled.read_text(encoding="utf-8").splitlines()
+    record = json.loads(line)
+    assert (record["page"], record["user"], record["queries"], record["db_ms"]) == ("admin/Fees", "admin", 1, 5.0)
+    assert record["python_ms"] >= 0
+    assert page_profiler.st.session_state["_page_traces"] == [record]
+
+
+def test_panel_history_is_bounded(enabled, monkeypatch):
+    monkeypatch.setattr(page_profiler, "PANEL_HISTORY", 3)
+    for _ in range(5):
+        with page_profiler.profile_page("student"):
+            pass
+    assert len(page_profiler.st.session_state["_page_traces"]) == 3
@@ -0,0 +1,81 @@
+import re
+import sqlite3
+
+import pytest
+
+import pagination
+
+NAMES = ["Asha", None, "Ravi", "asha", "Asha", None, "Zoya", "Ben", "Ravi", "Chen", None]
+
+
+@pytest.fixture
+def students(monkeypatch):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE student_details (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO student_details (id, name) VALUES (?, ?)", enumerate(NAMES, start=1))
+
+    def fetch(query, params=None, read_only=False):
+        return conn.execute(re.sub(r"%s", "?", query), tuple(params or ())).fetchall()
+
+    monkeypatch.setattr(pagination, "fetch_details", fetch)
+    yield conn
+    conn.close()
+
+
+def all_pages(page_size, **kwargs):
+    pages, cursor = [], None
+    while True:
+        rows, cursor = pagination.fetch_page(
+            "SELECT id, name FROM student_details", sort_col="name", id_col="id",
+            cursor_of=lambda row: (row[1], row[0]), cursor=cursor, page_size=page_size, **kwargs)
+        pages.append(rows)
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 4, 20])
+def test_pages_cover_every_row_once_in_order(students, page_size):
+    expected = students.execute("SELECT id, name FROM student_details ORDER BY name, id").fetchall()
+    pages = all_pages(page_size)
+    assert [row for page in pages for row in page] == expected
+    assert all(len(page) == page_size for page in pages[:-1])
+
+
+def test_filters_are_applied_on_every_page(students):
+    pages = all_pages(1, filters=[("name LIKE %s", ("R%",)), ("", ())])
+    assert [row for page in pages for row in page] == [(3, "Ravi"), (9, "Ravi")]
+
+
+def test_failed_query_returns_no_page(monkeypatch):
+    monkeypatch.setattr(pagination, "fetch_details", lambda *a, **k: None)
+    assert pagination.fetch_page("SELECT id FROM t", "id", "id", cursor_of=lambda r: r) == (None, None)
+
+
+def test_escape_like():
+    assert pagination.escape_like(r"50%_a\b") == r"50\%\_a\\b"
+
+
+@pytest.mark.parametrize("term, expected", [
+    ("", None),
+    ("   ", None),
+    ("98 765", ("phoneno LIKE %s", ("98765%",))),
+    ("+9198", ("phoneno LIKE %s", ("+9198%",))),
+    ("asha rao", ("MATCH(name) AGAINST (%s IN BOOLEAN MODE)", ("+asha* +rao*",))),
+    ("as", ("name LIKE %s", ("as%",))),
+    ("asha r", ("name LIKE %s", ("asha r%",))),
+    ("o_neil", ("MATCH(name) AGAINST (%s IN BOOLEAN MODE)", ("+o_neil*",))),
+])
+def test_text_search(term, expected):
+    assert pagination.text_search(term, "name", "phoneno") == expected
+
+
+def test_text_search_without_fulltext_uses_prefix():
+    assert pagination.text_search("asha rao", "name", fulltext=False) == ("name LIKE %s", ("asha rao%",))
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 5])
+def test_descending_pages_put_nulls_last(students, page_size):
+    expected = students.execute(
+        "SELECT id, name FROM student_details ORDER BY name IS NULL, name DESC, id DESC").fetchall()
+    pages = all_pages(page_size, descending=True)
+    assert [row for page in pages for row in page] == expected
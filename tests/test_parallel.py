@@ -0,0 +1,42 @@
+import contextvars
+import threading
+import time
+
+import pytest
+
+import config
+
+page = contextvars.ContextVar("page", default=None)
+
+
+def test_results_keep_call_order_even_when_later_calls_finish_first():
+    def call(value, delay):
+        return lambda: (time.sleep(delay), value)[1]
+
+    assert config.run_parallel([call("slow", 0.05), call("fast", 0)]) == ["slow", "fast"]
+
+
+def test_calls_run_on_worker_threads_with_the_callers_context():
+    page.set("Student Dashboard")
+    seen = config.run_parallel([lambda: (page.get(), threading.current_thread().name)] * 2)
+    assert all(name == "Student Dashboard" for name, _ in seen)
+    assert all(thread.startswith("db-fanout") for _, thread in seen)
+
+
+def test_a_single_call_runs_inline():
+    assert config.run_parallel([threading.current_thread]) == [threading.current_thread()]
+    assert config.run_parallel([]) == []
+
+
+def test_exceptions_are_raised_in_the_caller():
+    def broken():
+        raise ValueError("bad query")
+
+    with pytest.raises(ValueError, match="bad query"):
+        config.run_parallel([lambda: 1, broken])
+
+
+def test_fetch_parallel_passes_each_query_and_params(monkeypatch):
+    monkeypatch.setattr(config, "fetch_details", lambda query, params=None: (query, params))
+    queries = [("SELECT 1", None), ("SELECT %s", (2,))]
+    assert config.fetch_parallel(queries) == queries
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+import config
+import query_cache
+from query_cache import QueryCache, tables_in
+
+
+def test_tables_in_reads_and_writes():
+    assert tables_in("SELECT s.name FROM student_details s JOIN results r ON r.student_id = s.id") == \
+        {"student_details", "results"}
+    assert tables_in("UPDATE `Fees` SET status='Paid'") == {"fees"}
+    assert tables_in("INSERT INTO attendance (a) VALUES (%s)") == {"attendance"}
+
+
+def test_tables_in_ignores_upsert_clause():
+    query = "INSERT INTO fee_totals (status) VALUES (%s) ON DUPLICATE KEY UPDATE records = records + 1"
+    assert tables_in(query) == {"fee_totals"}
+
+
+def test_hit_and_miss():
+    cache = QueryCache()
+    assert cache.get("k") is None
+    assert cache.put("k", frozenset({"fees"}), ((1,),), cache.versions({"fees"}))
+    assert cache.get("k") == ((1,),)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_invalidate_drops_entries_reading_the_table():
+    cache = QueryCache()
+    cache.put("fees", frozenset({"fees"}), ((1,),), cache.versions({"fees"}))
+    cache.put("both", frozenset({"fees", "results"}), ((2,),), cache.versions({"fees", "results"}))
+    cache.put("results", frozenset({"results"}), ((3,),), cache.versions({"results"}))
+    assert cache.invalidate(frozenset({"fees"})) == 2
+    assert cache.get("fees") is None
+    assert cache.get("both") is None
+    assert cache.get("results") == ((3,),)
+
+
+def test_put_refuses_rows_read_before_a_write():
+    cache = QueryCache()
+    versions = cache.versions({"fees"})
+    cache.invalidate(frozenset({"fees"}))  # a write lands while the read is in flight
+    assert not cache.put("k", frozenset({"fees"}), ((1,),), versions)
+    assert cache.get("k") is None
+
+
+def test_entries_expire_after_ttl():
+    cache = QueryCache(ttl=0.01)
+    cache.put("k", frozenset({"fees"}), ((1,),), cache.versions({"fees"}))
+    time.sleep(0.02)
+    assert cache.get("k") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, frozenset({"t"}), ((key,),), cache.versions({"t"}))
+    cache.get("a")
+    cache.put("c", frozenset({"t"}), (("c",),), cache.versions({"t"}))
+    assert cache.get("b") is None
+    assert cache.get("a") == (("a",),)
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    cache = QueryCache()
+    monkeypatch.setattr(query_cache, "_cache", cache)
+    monkeypatch.setattr(query_cache, "ENABLED", True)
+    return cache
+
+
+def test_fetch_cached_serves_repeat_reads_from_memory(fresh_cache, monkeypatch):
+    reads = []
+    monkeypatch.setattr(config, "_read", lambda q, p, ro: reads.append(q) or ([(7,)], False))
+    assert config.fetch_cached("SELECT COUNT(*) FROM fees") == [(7,)]
+    assert config.fetch_cached("SELECT COUNT(*) FROM fees") == [(7,)]
+    assert len(reads) == 1
+    query_cache.invalidate_tables(["FEES"])
+    config.fetch_cached("SELECT COUNT(*) FROM fees")
+    assert len(reads) == 2
+
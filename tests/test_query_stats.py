@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+import query_stats
+
+
+class _Log:
+    def __init__(self):
+        self.lines = []
+
+    def info(self, line):
+        self.lines.append(json.loads(line))
+
+
+@pytest.fixture(autouse=True)
+def slow_log(monkeypatch):
+    log = _Log()
+    monkeypatch.setattr(query_stats, "SLOW_QUERY_MS", 1000.0)
+    monkeypatch.setattr(query_stats, "_get_slow_logger", lambda: log)
+    return log
+
+
+def test_fingerprint_replaces_literals_and_placeholders():
+    literal = query_stats.fingerprint("SELECT * FROM fees WHERE student_name = 'Asha' AND amount > 500")
+    bound = query_stats.fingerprint("SELECT * FROM fees WHERE student_name = %s AND amount > %s")
+    assert literal == bound == "SELECT * FROM fees WHERE student_name = ? AND amount > ?"
+
+
+def test_fingerprint_collapses_in_lists_and_multi_row_values():
+    assert query_stats.fingerprint("SELECT id FROM t WHERE id IN (%s, %s, %s)") == \
+        query_stats.fingerprint("SELECT id FROM t WHERE id IN (1,2)")
+    assert query_stats.fingerprint("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)") == \
+        "INSERT INTO t (a, b) VALUES (?, ?), ..."
+
+
+def test_fingerprint_normalizes_whitespace():
+    assert query_stats.fingerprint("SELECT  a\n   FROM t\n WHERE x=1") == "SELECT a FROM t WHERE x=?"
+
+
+def test_record_aggregates_by_fingerprint():
+    query_stats.record("SELECT a FROM t WHERE id=1", 10.0, rows=1)
+    query_stats.record("SELECT a FROM t WHERE id=2", 30.0, rows=3, acquire_ms=2.0)
+    [entry] = query_stats.snapshot()
+    assert entry["count"] == 2
+    assert entry["total_ms"] == 40.0
+    assert entry["max_ms"] == 30.0
+    assert entry["avg_rows"] == 2.0
+    assert entry["avg_acquire_ms"] == 1.0
+
+
+def test_percentiles_come_from_samples():
+    for ms in range(1, 101):
+        query_stats.record("SELECT 1", float(ms))
+    [entry] = query_stats.snapshot()
+    assert entry["p50_ms"] == 50.0
+    assert entry["p95_ms"] == 95.0
+    assert entry["p99_ms"] == 99.0
+
+
+def test_only_slow_or_failed_statements_are_logged(slow_log):
+    query_stats.record("SELECT 1", 5.0)
+    query_stats.record("SELECT 2", 1500.0)
+    query_stats.record("SELECT 3", 1.0, error=RuntimeError("gone"))
+    assert [(line["ms"], line["error"]) for line in slow_log.lines] == [(1500.0, None), (1.0, "gone")]
+
+
+def test_timed_records_rows_and_errors():
+    with query_stats.timed("SELECT a FROM t") as timing:
+        timing["rows"] = 4
+    with pytest.raises(RuntimeError):
+        with query_stats.timed("SELECT a FROM t"):
+            raise RuntimeError("boom")
+    [entry] = query_stats.snapshot()
+    assert entry["count"] == 2
+    assert entry["errors"] == 1
+    assert entry["avg_rows"] == 2.0
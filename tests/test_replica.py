@@ -0,0 +1,124 @@
+import time
+
+import mysql.connector
+import pytest
+
+import config
+import query_cache
+from conftest import FakeConnection
+from query_cache import QueryCache
+
+
+@pytest.fixture
+def router(monkeypatch):
+    """A router with a configured replica reporting 0.5s of lag"""
+    router = config.ReplicaRouter(max_lag=5.0, check_every=60.0, retry_after=30.0)
+    monkeypatch.setattr(router, "_measure_lag", lambda: 0.5)
+    monkeypatch.setattr(config, "_router", router)
+    monkeypatch.setattr(config, "get_replica_pool", lambda: object())
+    return router
+
+
+def test_no_replica_means_primary(router, monkeypatch):
+    monkeypatch.setattr(config, "get_replica_pool", lambda: None)
+    assert router.use_replica("asha") is False
+
+
+def test_replica_is_used_only_within_max_lag(router, monkeypatch):
+    assert router.use_replica("asha") is True
+    router._checked_at = None
+    monkeypatch.setattr(router, "_measure_lag", lambda: 9.0)
+    assert router.use_replica("asha") is False
+    assert router.stats()["replica_share"] == 0.5
+
+
+def test_a_session_reads_its_own_writes_from_the_primary(router):
+    router.note_write("asha")
+    assert router.use_replica("asha") is False
+    assert router.use_replica("ravi") is True
+
+
+def test_writes_outside_a_session_hold_back_every_session(router):
+    router.note_write(None)
+    assert router.use_replica("ravi") is False
+
+
+def test_unknown_lag_backs_off_for_retry_after(router, monkeypatch):
+    monkeypatch.setattr(router, "_measure_lag", lambda: None)
+    assert router.use_replica("asha") is False
+    assert router.stats()["failures"] == 1
+    monkeypatch.setattr(router, "_measure_lag", lambda: 0.5)
+    assert router.use_replica("asha") is False  # still inside retry_after
+
+
+def test_note_write_forgets_writes_that_can_no_longer_matter(router):
+    router._last_write = {"old": time.monotonic() - 60, "recent": time.monotonic()}
+    router.note_write("asha")
+    assert set(router._last_write) == {"recent", "asha"}
+
+
+class StatusConnection(FakeConnection):
+    def cursor(self, *args, **kwargs):
+        cursor = super().cursor()
+        cursor.description = [("Replica_IO_Running",), ("Seconds_Behind_Source",)]
+        return cursor
+
+
+def replica_pool(monkeypatch, conn):
+    pool = config.ConnectionPool(lambda: conn, size=1, timeout=0.05)
+    monkeypatch.setattr(config, "_replica_pool", pool)
+    return pool
+
+
+def test_measure_lag_reads_seconds_behind_source(monkeypatch):
+    replica_pool(monkeypatch, StatusConnection("replica", rows=[("Yes", 3)]))
+    assert config.ReplicaRouter._measure_lag() == 3.0
+
+
+def test_measure_lag_without_replication_status_is_unknown(monkeypatch, capsys):
+    replica_pool(monkeypatch, StatusConnection("replica", rows=[]))
+    assert config.ReplicaRouter._measure_lag() is None
+    assert "no replication status" in capsys.readouterr().out
+
+
+def test_measure_lag_when_not_replicating_is_unknown(monkeypatch):
+    replica_pool(monkeypatch, StatusConnection("replica", rows=[("No", None)]))
+    assert config.ReplicaRouter._measure_lag() is None
+
+
+def test_stream_falls_back_to_the_primary_when_the_replica_fails(router, monkeypatch):
+    replica = FakeConnection("replica")
+    replica.fail_with = mysql.connector.errors.InterfaceError("replica gone")
+    pool = replica_pool(monkeypatch, replica)
+    monkeypatch.setattr(config, "get_replica_pool", lambda: pool)
+    primary = FakeConnection("primary", rows=[(1,), (2,)])
+    monkeypatch.setattr(config, "_pool", config.ConnectionPool(lambda: primary, size=1, timeout=0.05))
+
+    assert list(config.stream_rows("SELECT id FROM attendance", read_only=True)) == [(1,), (2,)]
+    assert pool.stats()["discarded"] == 1
+    assert config.get_pool().stats()["idle"] == 1
+    assert router.stats()["failures"] == 1
+
+
+def test_stream_fallback_without_a_primary_raises_cleanly(router, monkeypatch):
+    replica = FakeConnection("replica")
+    replica.fail_with = mysql.connector.errors.InterfaceError("replica gone")
+    pool = replica_pool(monkeypatch, replica)
+    monkeypatch.setattr(config, "get_replica_pool", lambda: pool)
+    monkeypatch.setattr(config, "_pool", config.ConnectionPool(lambda: None, size=1, timeout=0.05))
+
+    with pytest.raises(ConnectionError):
+        list(config.stream_rows("SELECT id FROM attendance", read_only=True))
+    assert pool.stats()["in_use"] == 0 and pool.stats()["discarded"] == 1
+
+
+def test_fetch_cached_does_not_store_replica_rows(monkeypatch):
+    cache = QueryCache()
+    monkeypatch.setattr(query_cache, "_cache", cache)
+    monkeypatch.setattr(query_cache, "ENABLED", True)
+    reads = []
+    monkeypatch.setattr(config, "_read", lambda q, p, ro: reads.append(q) or ([(7,)], True))
+    config.fetch_cached("SELECT COUNT(*) FROM fees", read_only=True)
+    config.fetch_cached("SELECT COUNT(*) FROM fees", read_only=True)
+    assert len(reads) == 2
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,50 @@
+import datetime
+
+import pytest
+
+import rollups
+from conftest import FakeTransaction
+
+
+@pytest.mark.parametrize("day, start, following", [
+    (datetime.date(2025, 3, 17), datetime.date(2025, 3, 1), datetime.date(2025, 4, 1)),
+    (datetime.date(2025, 1, 31), datetime.date(2025, 1, 1), datetime.date(2025, 2, 1)),
+    (datetime.date(2024, 12, 1), datetime.date(2024, 12, 1), datetime.date(2025, 1, 1)),
+])
+def test_month_bounds(day, start, following):
+    assert rollups.month_start(day) == start
+    assert rollups.next_month(day) == following
+
+
+def test_refresh_attendance_recomputes_one_month_for_distinct_students():
+    tx = FakeTransaction()
+    rollups.refresh_attendance(tx, [5, 3, 5], datetime.date(2025, 2, 14))
+    [(sql, params)] = tx.statements
+    assert "student_id IN (%s, %s)" in sql
+    assert params == (datetime.date(2025, 2, 1), 3, 5, datetime.date(2025, 2, 1), datetime.date(2025, 3, 1))
+
+
+def test_refresh_attendance_without_students_is_a_no_op():
+    tx = FakeTransaction()
+    assert rollups.refresh_attendance(tx, [], datetime.date(2025, 2, 14)) == 0
+    assert tx.statements == []
+
+
+def test_fee_delta_stores_null_keys_as_unspecified():
+    tx = FakeTransaction()
+    rollups.add_fee(tx, None, None, None)
+    assert tx.statements[0][1] == ("", "", 1, 0)
+
+
+def test_remove_fees_subtracts_each_group():
+    tx = FakeTransaction(rows=[("Paid", "Tuition", 2, 3000), (None, "Library", 1, 50)])
+    assert rollups.remove_fees(tx, "student_name = %s", ("Asha",)) == 3
+    select, *deltas = tx.statements
+    assert "FOR UPDATE" in select[0] and select[1] == ("Asha",)
+    assert [params for _, params in deltas] == [("Paid", "Tuition", -2, -3000), ("", "Library", -1, -50)]
+
+
+def test_remove_student_clears_both_rollups():
+    tx = FakeTransaction()
+    rollups.remove_student(tx, 9, "Asha")
+    assert tx.statements[-1] == ("DELETE FROM attendance_monthly WHERE student_id = %s", (9,))
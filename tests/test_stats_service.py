@@ -0,0 +1,30 @@
+import sqlite3
+from decimal import Decimal
+
+import stats_service
+
+
+def test_overview_stats_maps_and_defaults_columns(monkeypatch):
+    monkeypatch.setattr(stats_service, "fetch_cached",
+                        lambda query, read_only=False: [(10, 4, 3, 250, Decimal("1200.50"), None, 30)])
+    stats = stats_service.get_overview_stats()
+    assert stats == stats_service.OverviewStats(10, 4, 3, 250, 1200.5, 0, 30)
+
+
+def test_overview_stats_is_none_when_the_database_is_unreachable(monkeypatch):
+    monkeypatch.setattr(stats_service, "fetch_cached", lambda query, read_only=False: None)
+    assert stats_service.get_overview_stats() is None
+
+
+def test_attendance_total_counts_every_row():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE student_details (id INTEGER);
+        CREATE TABLE faculty_details (id INTEGER, department TEXT);
+        CREATE TABLE attendance (student_id INTEGER, status TEXT);
+        CREATE TABLE fee_totals (status TEXT, total REAL);
+        CREATE TABLE results (course TEXT);
+        INSERT INTO attendance VALUES (1, 'Present'), (1, 'Late'), (NULL, 'Absent'), (2, NULL);
+    """)
+    row = conn.execute(stats_service.OVERVIEW_QUERY).fetchone()
+    assert row[3] == 4